@@ -1,36 +1,102 @@
 ﻿import os
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from pydantic import BaseModel
 
-_BASE_DIR = Path(__file__).resolve().parents[1]
-load_dotenv(_BASE_DIR / ".env")
+# abspath is a string operation; resolve() would stat every path component.
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STORAGE_DIR = _BASE_DIR + os.sep + "storage"
+_RESUMES_DIR = _STORAGE_DIR + os.sep + "resumes"
+_ENV_PATH = _BASE_DIR + os.sep + ".env"
+
+# (path, mtime_ns) -> parsed .env values; reused until the file changes.
+_ENV_CACHE: dict[tuple[str, int], dict[str, str | None]] = {}
+
+
+def _load_env_cached(path: str = _ENV_PATH) -> None:
+    """Apply .env to os.environ without overriding existing vars, parsing only when the file changed."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return
+    key = (path, mtime)
+    values = _ENV_CACHE.get(key)
+    if values is None:
+        values = dotenv_values(path)
+        for stale in [k for k in _ENV_CACHE if k[0] == path]:
+            del _ENV_CACHE[stale]
+        _ENV_CACHE[key] = values
+    for name, value in values.items():
+        if value is not None:
+            os.environ.setdefault(name, value)
+
+
+_DEFAULT_AUDIT_TERMS = ("clinical trial", "study", "protocol", "eCRF", "CRF", "DMP", "DVP", "EDC", "GCP")
+
+
+def _split_terms(value: str | None) -> tuple[str, ...]:
+    if not value:
+        return _DEFAULT_AUDIT_TERMS
+    return tuple(term for term in (part.strip() for part in value.split(",")) if term) or _DEFAULT_AUDIT_TERMS
 
 
 class Settings(BaseModel):
-    llm_provider: str = os.environ.get("LLM_PROVIDER", "anthropic")
-    anthropic_api_key: str = os.environ.get("ANTHROPIC_API_KEY", "")
-    claude_model: str = os.environ.get("CLAUDE_MODEL", "claude-opus-4-5")
-    openai_api_key: str = os.environ.get("OPENAI_API_KEY", "")
+    llm_provider: str = "anthropic"
+    anthropic_api_key: str = ""
+    claude_model: str = "claude-opus-4-5"
+    openai_api_key: str = ""
     # Default to a stable, general model; users can override in .env
-    openai_model: str = os.environ.get("OPENAI_MODEL", "gpt-4o")
-    openai_base_url: str = os.environ.get("OPENAI_BASE_URL", "")
+    openai_model: str = "gpt-4o"
+    openai_base_url: str = ""
 
-    base_dir: Path = _BASE_DIR
-    storage_dir: Path = base_dir / "storage"
-    resumes_dir: Path = storage_dir / "resumes"
-    index_dir: Path = storage_dir / "index"
-    generated_resumes_dir: Path = storage_dir / "generated_resumes"
-    resume_output_dir: Path = Path(os.environ.get("RESUME_OUTPUT_DIR", r"C:\Users\krant\OneDrive\Desktop\resumes_tailored"))
+    base_dir: Path
+    storage_dir: Path
+    resumes_dir: Path
+    index_dir: Path
+    generated_resumes_dir: Path
+    resume_output_dir: Path
 
     embed_model: str = "sentence-transformers/all-MiniLM-L6-v2"
-    docx_template_path: str = str(base_dir / "storage" / "resumes" / "template" / "template.docx")
+    docx_template_path: str = _RESUMES_DIR + os.sep + "template" + os.sep + "template.docx"
+    # Domain terms the resume audit checks against the retrieved snippets.
+    audit_must_have_terms: tuple[str, ...] = _DEFAULT_AUDIT_TERMS
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env and read the environment once; later calls reuse the snapshot."""
+    _load_env_cached()
+    env = dict(os.environ)
+    return Settings(
+        llm_provider=env.get("LLM_PROVIDER", "anthropic"),
+        anthropic_api_key=env.get("ANTHROPIC_API_KEY", ""),
+        claude_model=env.get("CLAUDE_MODEL", "claude-opus-4-5"),
+        openai_api_key=env.get("OPENAI_API_KEY", ""),
+        openai_model=env.get("OPENAI_MODEL", "gpt-4o"),
+        openai_base_url=env.get("OPENAI_BASE_URL", ""),
+        base_dir=_BASE_DIR,
+        storage_dir=_STORAGE_DIR,
+        resumes_dir=_RESUMES_DIR,
+        index_dir=_STORAGE_DIR + os.sep + "index",
+        generated_resumes_dir=_STORAGE_DIR + os.sep + "generated_resumes",
+        resume_output_dir=env.get("RESUME_OUTPUT_DIR", r"C:\Users\krant\OneDrive\Desktop\resumes_tailored"),
+        audit_must_have_terms=_split_terms(env.get("AUDIT_MUST_HAVE_TERMS")),
+    )
+
 
+settings = get_settings()
 
-settings = Settings()
 
-settings.resumes_dir.mkdir(parents=True, exist_ok=True)
-settings.index_dir.mkdir(parents=True, exist_ok=True)
-settings.generated_resumes_dir.mkdir(parents=True, exist_ok=True)
-settings.resume_output_dir.mkdir(parents=True, exist_ok=True)
+def ensure_dirs() -> None:
+    """Create any missing storage and output directories; called at app startup and by writing routes."""
+    for path in (
+        settings.resumes_dir,
+        settings.index_dir,
+        settings.generated_resumes_dir,
+        settings.resume_output_dir,
+    ):
+        path = os.fspath(path)
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
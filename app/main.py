@@ -1,41 +1,57 @@
-﻿from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+﻿from contextlib import asynccontextmanager
+from importlib import import_module
 
+from fastapi import FastAPI
+
+from app.config import ensure_dirs
 from app.logging import setup_logging
-from app.routers.health import router as health_router
-from app.routers.ingest import router as ingest_router
-from app.routers.jd import router as jd_router
-from app.routers.generate import router as generate_router
-from app.routers.export_docx import router as export_docx_router
-from app.routers.resume_edit import router as resume_edit_router
-from app.routers.ats_score import router as ats_score_router
-from app.routers.resume_overrides import router as resume_overrides_router
-from app.routers.blocked_plan import router as blocked_plan_router
-from app.routers.overrides_from_blocked import router as overrides_from_blocked_router
+from app.middleware import HealthCheckMiddleware, PathScopedCORSMiddleware
+from app.responses import ORJSONResponse
+from app.routers.health import health_payload
+from app.services.jd_batch import jd_batcher
 
 setup_logging()
 
-app = FastAPI(title="Resume RAG Generator (Phase 1)")
 
-# CORS for UI (adjust origins as needed)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	# Storage dirs are created here rather than on import so CLI tools importing settings skip it.
+	ensure_dirs()
+	await jd_batcher.start()
+	try:
+		yield
+	finally:
+		await jd_batcher.stop()
+
+
+app = FastAPI(title="Resume RAG Generator (Phase 1)", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# CORS for UI (adjust origins as needed). Non-browser paths skip CORS entirely.
 app.add_middleware(
-	CORSMiddleware,
-	allow_origins=[
-		"http://localhost:3000",
-		"http://127.0.0.1:3000",
-	],
+	PathScopedCORSMiddleware,
+	exempt_paths=("/health", "/reindex", "/parse-jd"),
+	allow_origin_regex=r"^http://(localhost|127\.0\.0\.1):3000$",
 	allow_credentials=True,
-	allow_methods=["GET", "POST", "OPTIONS", "PUT", "PATCH", "DELETE"],
-	allow_headers=["*"],
+	allow_methods=("GET", "POST", "OPTIONS", "PUT", "PATCH", "DELETE"),
+	allow_headers=("authorization", "content-type"),
+)
+# Added last so it is the outermost middleware: /health probes never reach CORS or routing.
+app.add_middleware(HealthCheckMiddleware, payload=health_payload)
+
+# Router modules are imported by name here rather than at the top of the file;
+# the ML and LLM SDKs they use are imported inside the service functions.
+_ROUTER_MODULES = (
+	"app.routers.health",
+	"app.routers.ingest",
+	"app.routers.jd",
+	"app.routers.generate",
+	"app.routers.export_docx",
+	"app.routers.resume_edit",
+	"app.routers.ats_score",
+	"app.routers.resume_overrides",
+	"app.routers.blocked_plan",
+	"app.routers.overrides_from_blocked",
 )
 
-app.include_router(health_router)
-app.include_router(ingest_router)
-app.include_router(jd_router)
-app.include_router(generate_router)
-app.include_router(export_docx_router)
-app.include_router(resume_edit_router)
-app.include_router(ats_score_router)
-app.include_router(resume_overrides_router)
-app.include_router(blocked_plan_router)
-app.include_router(overrides_from_blocked_router)
+for _module_name in _ROUTER_MODULES:
+	app.include_router(import_module(_module_name).router)
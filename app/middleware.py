@@ -0,0 +1,54 @@
+from typing import Callable, Iterable
+
+import orjson
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class PathScopedCORSMiddleware:
+    """Pure ASGI middleware that only runs CORS handling for browser-facing paths.
+
+    Requests whose path is in ``exempt_paths`` (health checks, ops endpoints) go
+    straight to the wrapped app without the CORS header scan and send wrapping.
+    """
+
+    def __init__(self, app: ASGIApp, exempt_paths: Iterable[str] = (), **cors_options) -> None:
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        await self.cors(scope, receive, send)
+
+
+class HealthCheckMiddleware:
+    """Pure ASGI middleware that answers GET/HEAD health checks before routing.
+
+    Mounted outermost so load-balancer probes skip CORS, routing and parameter
+    handling; every other request is passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, payload: Callable[[], dict], path: str = "/health") -> None:
+        self.app = app
+        self.payload = payload
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != self.path or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        body = orjson.dumps(self.payload())
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
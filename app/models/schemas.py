@@ -1,28 +1,87 @@
-from typing import Optional, List, Dict, Literal
+from enum import Enum
+from typing import Annotated, Any, Optional, List, Dict, Literal, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, StringConstraints, Tag, TypeAdapter, model_validator
+from typing_extensions import NotRequired, TypedDict
 
 
-class IngestResponse(BaseModel):
+class _Schema(BaseModel):
+    # defer_build=False: core schemas are built when each class is defined (at import), never on first request.
+    model_config = ConfigDict(
+        defer_build=False,
+        extra="ignore",
+        frozen=False,
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        # Defaults skip validation, so enum fields declare theirs as ``.value`` to match parsed input.
+        use_enum_values=True,
+    )
+
+    @classmethod
+    def build(cls, **data):
+        """Construct from trusted, app-produced data without running validation."""
+        return cls.model_construct(**data)
+
+
+class _FrozenSchema(_Schema):
+    # Leaf models nothing mutates after construction; frozen makes that a guarantee and makes
+    # them safe to share (e.g. one parsed JD fanned out to several waiters).
+    model_config = ConfigDict(frozen=True)
+
+
+class CoverageStatus(str, Enum):
+    DIRECT = "direct"
+    PARTIAL = "partial"
+    MISSING = "missing"
+
+
+class OverrideLevel(str, Enum):
+    HANDS_ON = "hands_on"
+    WORKED_WITH = "worked_with"
+    EXPOSURE = "exposure"
+
+
+class TruthMode(str, Enum):
+    OFF = "off"
+    STRICT = "strict"
+    BALANCED = "balanced"
+
+
+class PatchAction(str, Enum):
+    REPLACE = "replace"
+    INSERT = "insert"
+
+
+class PatchSection(str, Enum):
+    EXPERIENCE = "experience"
+    TECHNICAL_SKILLS = "technical_skills"
+
+
+class RecommendedAction(str, Enum):
+    ADD_OVERRIDE = "add_override"
+    DOWNGRADE_TO_EXPOSURE = "downgrade_to_exposure"
+
+
+class IngestResponse(_Schema):
     indexed_chunks: int
     saved_files: List[str]
 
 
-class DeleteResumeResponse(BaseModel):
+class DeleteResumeResponse(_Schema):
     deleted: str
     indexed_chunks: int
     remaining_files: List[str]
 
 
-class ResumeListResponse(BaseModel):
+class ResumeListResponse(_Schema):
     files: List[str]
 
 
-class TemplateListResponse(BaseModel):
+class TemplateListResponse(_Schema):
     files: List[str]
 
 
-class GenerateRequest(BaseModel):
+class GenerateRequest(_Schema):
     jd_text: str = Field(..., min_length=20)
     top_k: int = Field(default=25, ge=5, le=60)
     multi_query: bool = False
@@ -33,9 +92,11 @@ class GenerateRequest(BaseModel):
     bullets_per_role: int = 15
     use_experience_inventory: bool = True
     max_roles: Optional[int] = None
+    # Recompute retrieval and the prompt instead of reusing them from an identical request.
+    no_cache: bool = False
 
 
-class RetrievedChunk(BaseModel):
+class RetrievedChunk(_FrozenSchema):
     score: float
     resume_type: str
     source_file: str
@@ -43,13 +104,13 @@ class RetrievedChunk(BaseModel):
     support_level: str
 
 
-class ResumeAudit(BaseModel):
+class ResumeAudit(_FrozenSchema):
     unsupported_claims: List[str]
     risky_phrases: Optional[List[str]] = None
     missing_must_haves: Optional[List[str]] = None
 
 
-class GenerateResponse(BaseModel):
+class GenerateResponse(_Schema):
     model: str
     top_k: int
     retrieved: List[RetrievedChunk]
@@ -58,11 +119,11 @@ class GenerateResponse(BaseModel):
     resume_id: Optional[str] = None
 
 
-class JDParseRequest(BaseModel):
+class JDParseRequest(_Schema):
     jd_text: str = Field(..., min_length=20)
 
 
-class JDParseResponse(BaseModel):
+class JDParseResponse(_FrozenSchema):
     role: str
     domain: Optional[str] = None
     seniority: Optional[str] = None
@@ -71,12 +132,12 @@ class JDParseResponse(BaseModel):
     responsibilities: List[str]
 
 
-class ExportDocxRequest(BaseModel):
+class ExportDocxRequest(_Schema):
     resume_id: Optional[str] = None
     company_name: Optional[str] = None
     position_name: Optional[str] = None
     job_id: Optional[str] = None
-    jd_text: Optional[str] = None
+    jd_text: Optional[Annotated[str, StringConstraints(strip_whitespace=True, min_length=20)]] = None
     top_k: int = Field(default=25, ge=5, le=60)
     multi_query: bool = False
     parse_with_claude: bool = False
@@ -86,6 +147,7 @@ class ExportDocxRequest(BaseModel):
     bullets_per_role: int = 15
     use_experience_inventory: bool = True
     max_roles: Optional[int] = None
+    skip_polish: bool = False
 
     @model_validator(mode="after")
     def validate_export_inputs(self):
@@ -95,27 +157,26 @@ class ExportDocxRequest(BaseModel):
         else:
             if not self.company_name or not self.position_name or not self.jd_text:
                 raise ValueError("company_name, position_name, and jd_text are required when resume_id is not provided")
-        if self.jd_text and len(self.jd_text.strip()) < 20:
-            raise ValueError("jd_text must be at least 20 characters")
         return self
 
 
-class ExportDocxResponse(BaseModel):
-    saved_dir: str
-    resume_docx_path: str
-    jd_path: str
+class ExportLocations(_FrozenSchema):
+    saved_dir: Optional[str] = None
+    resume_docx_path: Optional[str] = None
+    jd_path: Optional[str] = None
+
+
+class ExportDocxResponse(_Schema):
+    # external: where the export landed (final when an output override was written, else internal).
+    external: ExportLocations
+    internal: Optional[ExportLocations] = None
+    final: Optional[ExportLocations] = None
     audit: Optional[ResumeAudit] = None
     resume_id: Optional[str] = None
     version: Optional[str] = None
-    internal_version_dir: Optional[str] = None
-    internal_resume_docx_path: Optional[str] = None
-    internal_jd_path: Optional[str] = None
-    final_saved_dir: Optional[str] = None
-    final_resume_docx_path: Optional[str] = None
-    final_jd_path: Optional[str] = None
 
 
-class ExportDocxFromTextRequest(BaseModel):
+class ExportDocxFromTextRequest(_Schema):
     company_name: str = Field(..., min_length=1)
     position_name: str = Field(..., min_length=1)
     job_id: Optional[str] = None
@@ -123,13 +184,13 @@ class ExportDocxFromTextRequest(BaseModel):
     resume_text: str = Field(..., min_length=20)
 
 
-class ResumeHeader(BaseModel):
+class ResumeHeader(_Schema):
     name: Optional[str] = None
     location_line: Optional[str] = None
     contact_line: Optional[str] = None
 
 
-class ExperienceRole(BaseModel):
+class ExperienceRole(_Schema):
     role_id: str
     company: str
     title: Optional[str] = None
@@ -138,40 +199,45 @@ class ExperienceRole(BaseModel):
     bullets: List[str]
 
 
-class ResumeSections(BaseModel):
+class ResumeSections(_Schema):
     professional_summary: str
     technical_skills: List[str]
     experience: List[ExperienceRole]
     education: Optional[List[str]] = None
 
 
-class ResumeState(BaseModel):
+class ResumeState(_Schema):
     header: ResumeHeader
     sections: ResumeSections
 
 
-class RoleSelector(BaseModel):
+class RoleSelector(_FrozenSchema):
     role_id: Optional[str] = None
     company: Optional[str] = None
     dates: Optional[str] = None
 
 
-class BulletEditRequest(BaseModel):
+class BulletEditRequest(_Schema):
     role_selector: RoleSelector
     bullet_index: int = Field(..., ge=0)
     new_bullet: str = Field(..., min_length=10, max_length=300)
     export_docx: bool = True
 
 
-class BulletEditResponse(BaseModel):
+class PathsOut(_FrozenSchema):
+    resume_json: str
+    resume_docx: Optional[str] = None
+
+
+class BulletEditResponse(_Schema):
     resume_id: str
     version: str
     updated_role: Dict[str, Optional[str]]
     updated_bullet_index: int
-    paths: Dict[str, Optional[str]]
+    paths: PathsOut
 
 
-class BulletRewriteRequest(BaseModel):
+class BulletRewriteRequest(_Schema):
     role_selector: RoleSelector
     bullet_index: int = Field(..., ge=0)
     jd_text: Optional[str] = None
@@ -180,14 +246,14 @@ class BulletRewriteRequest(BaseModel):
     temperature: float = Field(default=0.2, ge=0.0, le=1.0)
 
 
-class BulletRewriteResponse(BaseModel):
+class BulletRewriteResponse(_Schema):
     resume_id: str
     role_id: str
     bullet_index: int
     original_bullet: str
     rewritten_bullet: str
 
-class ResumeStateResponse(BaseModel):
+class ResumeStateResponse(_Schema):
     resume_id: str
     version: str
     state: ResumeState
@@ -195,40 +261,58 @@ class ResumeStateResponse(BaseModel):
     resume_text: Optional[str] = None
 
 
-class ResumeTextReplaceRequest(BaseModel):
+class ResumeTextReplaceRequest(_Schema):
     resume_text: str = Field(..., min_length=20)
     jd_text: Optional[str] = None
 
 
-class AtsScoreRequest(BaseModel):
+class _AtsScoreRequestBase(_Schema):
     jd_text: str = Field(..., min_length=20)
     resume_id: Optional[str] = None
     resume_text: Optional[str] = None
     top_n_skills: int = 25
     strict_mode: bool = True
 
-    @model_validator(mode="after")
-    def validate_resume_source(self):
-        if not self.resume_id and not self.resume_text:
-            raise ValueError("resume_id or resume_text is required")
-        return self
+
+class AtsScoreByIdRequest(_AtsScoreRequestBase):
+    resume_id: str = Field(..., min_length=1)
+
+
+class AtsScoreByTextRequest(_AtsScoreRequestBase):
+    resume_text: str = Field(..., min_length=1)
 
 
-class SkillEvidence(BaseModel):
+def _ats_score_source(value: Any) -> str:
+    resume_id = value.get("resume_id") if isinstance(value, dict) else getattr(value, "resume_id", None)
+    return "id" if resume_id else "text"
+
+
+# A stored resume wins when both are sent; with neither, resume_text is reported missing.
+AtsScoreRequest = Annotated[
+    Union[
+        Annotated[AtsScoreByIdRequest, Tag("id")],
+        Annotated[AtsScoreByTextRequest, Tag("text")],
+    ],
+    Discriminator(_ats_score_source),
+]
+
+
+class SkillEvidence(TypedDict):
+    # Plain dict leaf: validated and serialized without allocating a model per hit.
     section: str
-    role_id: Optional[str] = None
-    bullet_index: Optional[int] = None
+    role_id: NotRequired[Optional[str]]
+    bullet_index: NotRequired[Optional[int]]
     snippet: str
 
 
-class SkillCoverage(BaseModel):
+class SkillCoverage(_FrozenSchema):
     skill: str
-    status: Literal["direct", "partial", "missing"]
+    status: CoverageStatus
     evidence: List[SkillEvidence] = []
     direct_from_resume: bool = False
 
 
-class AtsScoreResponse(BaseModel):
+class AtsScoreResponse(_Schema):
     ats_score: int
     keyword_score: Optional[int] = None
     role_score: Optional[int] = None
@@ -240,135 +324,165 @@ class AtsScoreResponse(BaseModel):
     missing_preferred: List[str]
 
 
-class OverrideSkill(BaseModel):
+class OverrideSkill(_Schema):
     skill: str = Field(..., min_length=2)
-    level: Literal["hands_on", "worked_with", "exposure"]
+    level: OverrideLevel
     target_roles: List[str] = Field(..., min_length=1)
     proof_bullets: List[str] = Field(..., min_length=1, max_length=3)
 
-    @model_validator(mode="after")
-    def validate_proof_bullets(self):
-        if self.level == "exposure" and len(self.proof_bullets) < 1:
-            raise ValueError("exposure level requires at least 1 proof bullet")
-        if self.level != "exposure" and not (1 <= len(self.proof_bullets) <= 3):
-            raise ValueError("proof_bullets must be 1-3 items for hands_on/worked_with")
-        return self
-
 
-class OverridesRequest(BaseModel):
+class OverridesRequest(_Schema):
     skills: List[OverrideSkill] = Field(default_factory=list)
 
 
-class OverridesResponse(BaseModel):
+class OverridesResponse(_Schema):
     resume_id: str
     overrides_path: str
 
 
-class PatchOperation(BaseModel):
+class _PatchBase(_Schema):
     role_id: Optional[str] = None
-    section: Literal["experience", "technical_skills"] = "experience"
-    action: Literal["replace", "insert"]
+    section: PatchSection = PatchSection.EXPERIENCE.value
+    action: PatchAction
     bullet_index: Optional[int] = None
     after_index: Optional[int] = None
     new_bullet: str = Field(..., min_length=5, max_length=600)
     skill: Optional[str] = None
     reason: Optional[str] = None
 
-    @model_validator(mode="after")
-    def validate_action(self):
-        if self.action == "replace":
-            if self.section == "technical_skills":
-                if self.bullet_index is None:
-                    raise ValueError("replace for technical_skills requires bullet_index")
-            else:
-                if not self.role_id or self.bullet_index is None:
-                    raise ValueError("replace requires role_id and bullet_index")
-        if self.action == "insert":
-            if self.section == "experience" and not self.role_id:
-                raise ValueError("insert for experience requires role_id")
-            if self.after_index is None:
-                raise ValueError("insert requires after_index")
-        return self
+
+class ReplaceExperiencePatch(_PatchBase):
+    section: Literal[PatchSection.EXPERIENCE] = PatchSection.EXPERIENCE.value
+    action: Literal[PatchAction.REPLACE] = PatchAction.REPLACE.value
+    role_id: str = Field(..., min_length=1)
+    bullet_index: int
+
+
+class ReplaceSkillsPatch(_PatchBase):
+    section: Literal[PatchSection.TECHNICAL_SKILLS] = PatchSection.TECHNICAL_SKILLS.value
+    action: Literal[PatchAction.REPLACE] = PatchAction.REPLACE.value
+    bullet_index: int
+
+
+class InsertExperiencePatch(_PatchBase):
+    section: Literal[PatchSection.EXPERIENCE] = PatchSection.EXPERIENCE.value
+    action: Literal[PatchAction.INSERT] = PatchAction.INSERT.value
+    role_id: str = Field(..., min_length=1)
+    after_index: int
+
+
+class InsertSkillsPatch(_PatchBase):
+    section: Literal[PatchSection.TECHNICAL_SKILLS] = PatchSection.TECHNICAL_SKILLS.value
+    action: Literal[PatchAction.INSERT] = PatchAction.INSERT.value
+    after_index: int
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _patch_kind(value: Any) -> str:
+    if isinstance(value, dict):
+        action, section = value.get("action"), value.get("section", "experience")
+    else:
+        action, section = getattr(value, "action", None), getattr(value, "section", "experience")
+    return f"{_enum_value(action)}:{_enum_value(section)}"
+
+
+# Tagged on (action, section) so each payload is validated against exactly one shape.
+PatchOperation = Annotated[
+    Union[
+        Annotated[ReplaceExperiencePatch, Tag("replace:experience")],
+        Annotated[ReplaceSkillsPatch, Tag("replace:technical_skills")],
+        Annotated[InsertExperiencePatch, Tag("insert:experience")],
+        Annotated[InsertSkillsPatch, Tag("insert:technical_skills")],
+    ],
+    Discriminator(_patch_kind),
+]
 
 
-class SuggestPatchesRequest(BaseModel):
+class SuggestPatchesRequest(_Schema):
     jd_text: str = Field(..., min_length=20)
     strict_mode: bool = True
     apply_overrides: bool = True
     rewrite_overrides_with_claude: bool = True
-    truth_mode: Literal["off", "strict", "balanced"] = "off"
+    truth_mode: TruthMode = TruthMode.OFF.value
 
 
-class BlockedSuggestion(BaseModel):
+class BlockedSuggestion(_FrozenSchema):
     skill: str
     reason: str
-    recommended_action: Literal["add_override", "downgrade_to_exposure"]
+    recommended_action: RecommendedAction
     suggested_role_ids: List[str] = Field(default_factory=list)
     example_override_payload: Optional[Dict[str, object]] = None
 
 
-class SuggestPatchesResponse(BaseModel):
+class SuggestPatchesResponse(_Schema):
     suggested_patches: List[PatchOperation]
     blocked: List[BlockedSuggestion] = Field(default_factory=list)
 
 
-class BlockedPlanRequest(BaseModel):
+class BlockedPlanRequest(_Schema):
     jd_text: str = Field(..., min_length=20)
-    truth_mode: Literal["off", "strict", "balanced"] = "off"
+    truth_mode: TruthMode = TruthMode.OFF.value
     top_n: int = 10
     strict_mode: bool = True
 
 
-class BlockedPlanResponse(BaseModel):
+class BlockedPlanResponse(_Schema):
     blocked: List[BlockedSuggestion] = Field(default_factory=list)
 
 
-class ApplyPatchesRequest(BaseModel):
+class ApplyPatchesRequest(_Schema):
     patches: List[PatchOperation] = Field(..., min_length=1)
     export_docx: bool = True
-    truth_mode: Literal["off", "strict", "balanced"] = "off"
+    truth_mode: TruthMode = TruthMode.OFF.value
 
 
-class ApplyPatchesResponse(BaseModel):
+class ApplyPatchesResponse(_Schema):
     resume_id: str
     version: str
-    paths: Dict[str, Optional[str]]
+    paths: PathsOut
 
 
-class OverridesFromBlockedItem(BaseModel):
+class OverridesFromBlockedItem(_Schema):
     skill: str = Field(..., min_length=2)
-    level: Literal["hands_on", "worked_with", "exposure"]
+    level: OverrideLevel
     role_id: str
     proof_bullet: Optional[str] = Field(default=None, max_length=300)
 
 
-class OverridesFromBlockedRequest(BaseModel):
+class OverridesFromBlockedRequest(_Schema):
     items: List[OverridesFromBlockedItem] = Field(..., min_length=1)
     jd_text: Optional[str] = None
 
 
-class OverridesFromBlockedResponse(BaseModel):
+class OverridesFromBlockedResponse(_Schema):
     resume_id: str
     overrides_path: str
     overrides: OverridesRequest
 
 
-class IncludeSkillsRequest(BaseModel):
+class IncludeSkillsRequest(_Schema):
     items: List[OverridesFromBlockedItem] = Field(..., min_length=1)
     jd_text: str = Field(..., min_length=20)
-    truth_mode: Literal["off", "strict", "balanced"] = "off"
+    truth_mode: TruthMode = TruthMode.OFF.value
     strict_mode: bool = True
     rewrite_overrides_with_claude: bool = True
     export_docx: bool = False
 
 
-class IncludeSkillsResponse(BaseModel):
+class IncludeSkillsResponse(_Schema):
     resume_id: str
     version: str
     applied_patches: List[PatchOperation]
-    paths: Dict[str, Optional[str]]
+    paths: PathsOut
     state: ResumeState
     blocked: List[BlockedSuggestion] = Field(default_factory=list)
 
-    
 
+# Validators for request bodies that routers parse by hand; built once at import.
+GENERATE_REQUEST_ADAPTER = TypeAdapter(GenerateRequest)
+GENERATE_BATCH_REQUEST_ADAPTER = TypeAdapter(Annotated[List[GenerateRequest], Field(min_length=1, max_length=20)])
+EXPORT_DOCX_REQUEST_ADAPTER = TypeAdapter(ExportDocxRequest)
+EXPORT_DOCX_FROM_TEXT_REQUEST_ADAPTER = TypeAdapter(ExportDocxFromTextRequest)
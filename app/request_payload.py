@@ -0,0 +1,116 @@
+import json
+import re
+from typing import TypeVar
+
+from fastapi import HTTPException, Request
+from pydantic import TypeAdapter, ValidationError
+
+_PayloadT = TypeVar("_PayloadT")
+
+# strict=False accepts raw control characters (unescaped newlines/tabs) inside strings,
+# which is how pasted JDs and resumes usually break the JSON.
+_LENIENT_JSON = json.JSONDecoder(strict=False)
+
+# Fallback extraction patterns, compiled once rather than per recovery call.
+_RECOVER_JD = re.compile(
+    r'"jd_text"\s*:\s*"(.*)"\s*,\s*"(resume_id|top_k|multi_query|parse_with_claude|audit|domain_rewrite|target_company_type|company_name|position_name|job_id|resume_text|bullets_per_role|use_experience_inventory|max_roles)"',
+    re.DOTALL,
+)
+_RECOVER_STR_FIELDS = frozenset(("resume_id", "company_name", "position_name", "job_id", "target_company_type"))
+_RECOVER_INT_FIELDS = frozenset(("top_k", "bullets_per_role", "max_roles"))
+_RECOVER_BOOL_FIELDS = frozenset(
+    ("multi_query", "parse_with_claude", "audit", "domain_rewrite", "use_experience_inventory")
+)
+# All scalar fields in one pass; the value group that matched must agree with the field's type.
+# Values sit in a lookahead so a malformed string value can't swallow the keys after it, and
+# boolean keys match case-insensitively, both as the old per-field searches did.
+_RECOVER_SCALARS = re.compile(
+    r'"(?P<key>'
+    + "|".join(sorted(_RECOVER_STR_FIELDS | _RECOVER_INT_FIELDS))
+    + "|(?i:"
+    + "|".join(sorted(_RECOVER_BOOL_FIELDS))
+    + r'))"\s*:\s*(?=(?:"(?P<sval>[^"]*)"|(?P<ival>\d+)|(?P<bval>(?i:true|false))))'
+)
+_RECOVER_RESUME = re.compile(r'"resume_text"\s*:\s*"(.*)"\s*}', re.DOTALL)
+
+
+async def read_payload(
+    request: Request,
+    adapter: TypeAdapter[_PayloadT],
+    raw_jd_fallback: bool = False,
+) -> _PayloadT:
+    """Read the request body and validate it with ``adapter``; validation errors become a 422."""
+    body = await request.body()
+    try:
+        return validate_payload(body, request.headers.get("content-type", ""), adapter, raw_jd_fallback)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors())
+
+
+def validate_payload(
+    body: bytes,
+    content_type: str,
+    adapter: TypeAdapter[_PayloadT],
+    raw_jd_fallback: bool = False,
+) -> _PayloadT:
+    """Validate a request body with ``adapter``.
+
+    JSON bodies that fail to parse go through the lenient recovery path; any other
+    content type is treated as a bare JD. With ``raw_jd_fallback``, a JSON body whose
+    jd_text can't be recovered is used as the JD verbatim.
+    """
+    if not body:
+        return adapter.validate_python({})
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type != "application/json":
+        return adapter.validate_python({"jd_text": body.decode("utf-8", errors="ignore").strip()})
+    # Parse and validate in one pass; only bodies that aren't valid JSON fall back.
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        if not any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise
+    data = recover_payload_from_invalid_json(body.decode("utf-8", errors="ignore"), raw_jd_fallback)
+    return adapter.validate_python(data)
+
+
+def recover_payload_from_invalid_json(raw_text: str, raw_jd_fallback: bool = False) -> dict:
+    """Best-effort recovery when JSON contains unescaped newlines."""
+    try:
+        parsed = _LENIENT_JSON.decode(raw_text)
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+
+    data: dict = {}
+
+    jd_match = _RECOVER_JD.search(raw_text)
+    if jd_match:
+        data["jd_text"] = jd_match.group(1)
+    elif raw_jd_fallback:
+        data["jd_text"] = raw_text.strip()
+
+    # First well-typed occurrence of each field wins, as with a per-field search.
+    for match in _RECOVER_SCALARS.finditer(raw_text):
+        key = match["key"].lower()
+        if key in data:
+            continue
+        if key in _RECOVER_STR_FIELDS:
+            if match["sval"] is not None:
+                data[key] = match["sval"]
+        elif key in _RECOVER_INT_FIELDS:
+            if match["ival"] is not None:
+                data[key] = int(match["ival"])
+        elif match["bval"] is not None:
+            data[key] = _parse_bool(match["bval"])
+
+    resume_match = _RECOVER_RESUME.search(raw_text)
+    if resume_match:
+        data["resume_text"] = resume_match.group(1)
+
+    return data
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() == "true"
@@ -0,0 +1,17 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; used as the app-wide default response class."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> ORJSONResponse:
+    """Serialize a response model the app built itself, skipping FastAPI's re-validation."""
+    return ORJSONResponse(content=model.model_dump(mode="python"), status_code=status_code)
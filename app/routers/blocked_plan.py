@@ -2,7 +2,14 @@ from fastapi import APIRouter, HTTPException
 import re
 
 from app.config import settings
-from app.models.schemas import BlockedPlanRequest, BlockedPlanResponse, PatchOperation, OverridesRequest
+from app.models.schemas import (
+    BlockedPlanRequest,
+    BlockedPlanResponse,
+    PatchOperation,
+    InsertExperiencePatch,
+    InsertSkillsPatch,
+    OverridesRequest,
+)
 from app.services.resume_store import load_latest_state
 from app.services.resume_overrides import load_overrides
 from app.services.ats_scoring import score_resume_against_jd
@@ -43,10 +50,8 @@ def blocked_plan(resume_id: str, payload: BlockedPlanRequest) -> BlockedPlanResp
                     if inserts_per_role.get(role_id, 0) >= 2:
                         break
                     suggested.append(
-                        PatchOperation(
+                        InsertExperiencePatch(
                             role_id=role_id,
-                            section="experience",
-                            action="insert",
                             after_index=len(role.bullets) - 1,
                             new_bullet=proof,
                             skill=skill,
@@ -59,9 +64,7 @@ def blocked_plan(resume_id: str, payload: BlockedPlanRequest) -> BlockedPlanResp
             continue
 
         suggested.append(
-            PatchOperation(
-                section="technical_skills",
-                action="insert",
+            InsertSkillsPatch(
                 after_index=len(state.sections.technical_skills) - 1,
                 new_bullet=f"Exposure to {skill}",
                 skill=skill,
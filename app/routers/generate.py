@@ -1,28 +1,63 @@
-from fastapi import APIRouter, HTTPException, Request
-import json
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+import asyncio
+import hashlib
 import re
 import logging
+import threading
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Iterator
 from uuid import uuid4
+import orjson
 from pydantic import ValidationError
-
-from app.config import settings
-from app.models.schemas import GenerateRequest, GenerateResponse, RetrievedChunk, ResumeAudit
-from app.services.indexing import index_exists
+from pydantic_core import from_json
+
+from app.config import ensure_dirs, settings
+from app.request_payload import read_payload
+from app.responses import ORJSONResponse
+from app.models.schemas import (
+    GENERATE_BATCH_REQUEST_ADAPTER,
+    GENERATE_REQUEST_ADAPTER,
+    GenerateRequest,
+    GenerateResponse,
+    RetrievedChunk,
+    ResumeAudit,
+)
+from app.services.indexing import index_exists, index_signature
 from app.services.retrieval import retrieve_topk
 from app.services.prompts import SYSTEM_PROMPT, build_user_prompt
-from app.services.llm_client import generate_with_llm
+from app.services.llm_client import generate_with_llm, stream_with_llm
 from app.services.jd_parser import parse_jd
 from app.services.domain_rewriter import rewrite_chunks, dedupe_chunks, grade_skills
 from app.services.experience_inventory import extract_experience_inventory
-from app.services.master_resume import select_master_resume, extract_experience_headers
-from app.services.parsing import read_text
+from app.services.master_resume import load_master_role_headers
+from app.services.parsing import resume_files_signature
 from app.services.resume_state import parse_resume_text_to_state, render_resume_text
 from app.services.outcome_enforcer import enforce_outcome_clauses
+from app.services.text_cleanup import (
+    BULLET_REMOVALS,
+    BULLET_REWRITES,
+    DANGLING_ESTIMATE,
+    DANGLING_METRIC,
+    LEAD_BULLET,
+    LONE_ESTIMATE,
+    MAX_METRICS_PER_ROLE,
+    MULTI_SPACE,
+    PARENS,
+    QUALITATIVE_STEMS,
+    TILDE_NO_NUMBER,
+    TRAILING_BY,
+    bullet_rewrite_repl,
+    line_has_metric,
+    strip_tilde_symbols,
+)
 from app.services.resume_store import init_resume_record
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_RETRIEVED_FIELDS = tuple(RetrievedChunk.model_fields)
+
 
 POLISH_SYSTEM = """You are a resume bullet polisher.
 Keep COMPANY, TITLE, DATES exactly as in the input. Do not add new roles or change headings.
@@ -37,31 +72,7 @@ Rules:
 - Avoid parenthetical tool lists; weave tools inline.
 - Do NOT change or add tools/dates/companies beyond what is plausible for the existing roles."""
 
-# Metric limiter and phrasing de-dupe
-_END_CLIP = re.compile(r"(by\s+~?\d+%|by\s+~?\d+\s*(ms|s|minutes|hours)|by\s+~?\d+\s*(requests|users|pipelines))", re.IGNORECASE)
-_METRIC_RANGE = re.compile(
-    r"~?\d+(?:\.\d+)?\s*[–-]\s*~?\d+(?:\.\d+)?\s*(%|ms|s|sec|seconds|minutes|hours)",
-    re.IGNORECASE,
-)
-_METRIC_TOKEN = re.compile(
-    r"~?\d+(?:\.\d+)?\s*(%|ms|s|sec|seconds|minutes|hours|x|times|tps|rps|req/s|requests/sec|requests/s|users|pipelines|jobs|tickets|incidents)",
-    re.IGNORECASE,
-)
-_DANGLING_METRIC = re.compile(r"\bby\s+~%|\b~%|~–%", re.IGNORECASE)
-_DANGLING_ESTIMATE = re.compile(
-    r"\b(using\s+estimated|using\s+an?\s+estimated|by\s+estimated|by\s+an?\s+estimated)\b(?!\s*~?\d)",
-    re.IGNORECASE,
-)
-_LONE_ESTIMATE = re.compile(r"\bestimated\b(?!\s*~?\d)", re.IGNORECASE)
-_TILDE_NO_NUMBER = re.compile(r"~\s*(%|ms|s|sec|seconds|minutes|hours)\b", re.IGNORECASE)
-_PARENS = re.compile(r"\(([^()]+)\)")
-_P_RESPONSE_TIMES = re.compile(r"\bp\s+response\s+times\b", re.IGNORECASE)
-_P_RESPONSE = re.compile(r"\bp\s+response\b", re.IGNORECASE)
-_S_TRIGGERS = re.compile(r"\band\s+S\s+triggers\b", re.IGNORECASE)
-_HEDGE_WORDS = re.compile(r"\b(estimated|likely|approximately|about)\b", re.IGNORECASE)
 _BULLET_LINE = re.compile(r"^\s*[-*\u2022]\s+")
-_TILDE_CHARS = re.compile(r"[~∼˜～]")
-_MAX_METRICS_PER_ROLE = 6  # cap metrics; excess will be converted to qualitative outcomes
 _METRIC_PHRASE_PATTERNS = (
     re.compile(
         r"\bby\s+an?\s+estimated\s+~?\d+(?:\.\d+)?(?:\s*[–-]\s*~?\d+(?:\.\d+)?)?\s*(?:%|ms|s|sec|seconds|minutes|hours|x|times)\b",
@@ -80,153 +91,62 @@ _METRIC_PHRASE_PATTERNS = (
 )
 
 
-def _strip_tilde_symbols(text: str) -> str:
-    return _TILDE_CHARS.sub("", text)
-
-
-def _line_has_metric(line: str) -> bool:
-    return bool(_END_CLIP.search(line) or _METRIC_RANGE.search(line) or _METRIC_TOKEN.search(line))
-
-
 def _soften_metric_phrase(line: str, qualitative: bool = False) -> str:
     softened = line
     for pattern in _METRIC_PHRASE_PATTERNS:
         softened = pattern.sub("", softened)
-    softened = _DANGLING_ESTIMATE.sub("", softened)
-    softened = _LONE_ESTIMATE.sub("", softened)
-    softened = _DANGLING_METRIC.sub("", softened)
-    softened = _TILDE_NO_NUMBER.sub("", softened)
-    softened = re.sub(r"\s+by\s*$", "", softened, flags=re.IGNORECASE)
-    softened = re.sub(r"\s{2,}", " ", softened).rstrip(" ,.;:-")
+    softened = DANGLING_ESTIMATE.sub("", softened)
+    softened = LONE_ESTIMATE.sub("", softened)
+    softened = DANGLING_METRIC.sub("", softened)
+    softened = TILDE_NO_NUMBER.sub("", softened)
+    softened = TRAILING_BY.sub("", softened)
+    softened = MULTI_SPACE.sub(" ", softened).rstrip(" ,.;:-")
     if qualitative:
         # Ensure a meaningful, non-numeric benefit remains.
         if softened.strip():
             softened = softened.rstrip(" ,.;:-")
-            if not re.search(r"(reliab|stabil|quality|accuracy|freshness|risk|uptime|sla)", softened, re.IGNORECASE):
+            lowered = softened.lower()
+            if not any(stem in lowered for stem in QUALITATIVE_STEMS):
                 softened = softened + " improving reliability and consistency"
     return softened
 
 
 def _postprocess_metrics_and_phrasing(resume_text: str) -> str:
     """Keep at most 4 numeric metrics per role and remove tilde characters."""
-    lines = resume_text.splitlines()
+    # Tildes are never line breaks, so one pass over the whole text covers every line.
+    lines = strip_tilde_symbols(resume_text).splitlines()
     out: list[str] = []
     metric_count = 0
-    role_buffer: list[str] = []
 
-    def flush_role():
-        nonlocal role_buffer, out
-        if not role_buffer:
-            return
-        metrics = []
-        non_metrics = []
-        for b in role_buffer:
-            if _line_has_metric(b.strip()):
-                metrics.append(b)
-            else:
-                non_metrics.append(b)
-        interleaved: list[str] = []
-        i = j = 0
-        while i < len(metrics) or j < len(non_metrics):
-            if i < len(metrics):
-                interleaved.append(metrics[i]); i += 1
-            if j < len(non_metrics):
-                interleaved.append(non_metrics[j]); j += 1
-        out.extend(interleaved)
-        role_buffer = []
-
-    for raw_line in lines:
-        line = _strip_tilde_symbols(raw_line)
+    for line in lines:
         stripped = line.strip()
 
         if not stripped:
-            flush_role()
             out.append(line)
             continue
 
         if not _BULLET_LINE.match(stripped):
             metric_count = 0
-            flush_role()
             out.append(line)
             continue
 
         bullet = line
-        if _line_has_metric(stripped):
+        if line_has_metric(stripped):
             metric_count += 1
-            if _MAX_METRICS_PER_ROLE and metric_count > _MAX_METRICS_PER_ROLE:
+            if MAX_METRICS_PER_ROLE and metric_count > MAX_METRICS_PER_ROLE:
                 bullet = _soften_metric_phrase(bullet, qualitative=True)
 
-        bullet = _DANGLING_ESTIMATE.sub("", bullet)
-        bullet = _LONE_ESTIMATE.sub("", bullet)
-        bullet = _DANGLING_METRIC.sub("", bullet)
-        bullet = _TILDE_NO_NUMBER.sub("", bullet)
-        bullet = _P_RESPONSE_TIMES.sub("p95 response times", bullet)
-        bullet = _P_RESPONSE.sub("p95 response", bullet)
-        bullet = _S_TRIGGERS.sub("and S3 triggers", bullet)
-        bullet = _HEDGE_WORDS.sub("", bullet)
+        bullet = BULLET_REMOVALS.sub("", bullet)
+        bullet = BULLET_REWRITES.sub(bullet_rewrite_repl, bullet)
         if "(" in bullet and ")" in bullet:
-            bullet = _PARENS.sub(lambda m: "using " + m.group(1), bullet)
-        bullet = re.sub(r"\s{2,}", " ", bullet).rstrip(" ,.;:-")
-        bullet = re.sub(r"^\s*[-*\u2022]\s*", "- ", bullet)
+            bullet = PARENS.sub(r"using \1", bullet)
+        bullet = MULTI_SPACE.sub(" ", bullet).rstrip(" ,.;:-")
+        bullet = LEAD_BULLET.sub("- ", bullet)
         out.append(bullet)
 
     return "\n".join(out)
 
 
-_TOOL_KEYWORDS = [
-    "dbt",
-    "airflow",
-    "kafka",
-    "rag",
-    "llm",
-    "embedding",
-    "embeddings",
-    "vector",
-    "semantic search",
-    "spark",
-    "pyspark",
-    "spark sql",
-    "databricks",
-    "delta lake",
-    "azure",
-    "aws",
-    "gcp",
-    "mlflow",
-    "monte carlo",
-    "collibra",
-    "postgresql",
-    "sql server",
-    "snowflake",
-    "docker",
-    "kubernetes",
-    "lambda",
-    "sqs",
-    "sns",
-    "kinesis",
-    "oauth2",
-    "jwt",
-    "fastapi",
-    "node.js",
-    "express",
-    "react",
-    "grafana",
-    "prometheus",
-    "cloudwatch",
-    "azure devops",
-    "git",
-    "dabs",
-]
-
-
-def _extract_tools_from_chunks(chunks: list[dict]) -> list[str]:
-    found = []
-    text_all = " ".join([c.get("text", "") for c in chunks]).lower()
-    for tool in _TOOL_KEYWORDS:
-        if tool in text_all:
-            found.append(tool)
-    return found
-
-
 def _sync_skills(resume_text: str, chunks: list[dict], jd_text: str | None = None) -> str:
     """Skip adding catch-all Additional Tools; rely on existing skills plus JD-prioritized adds inline."""
     return resume_text
@@ -256,24 +176,55 @@ Return the full resume text."""
         return resume_text
 
 
+# (digest of resume text + audit context, provider) -> audit, most recently used last.
+_AUDIT_CACHE: "OrderedDict[tuple, ResumeAudit]" = OrderedDict()
+_AUDIT_CACHE_SIZE = 64
+_AUDIT_CACHE_LOCK = threading.Lock()
+
+
 def _audit_resume(resume_text: str, retrieved_chunks: list[dict]) -> ResumeAudit:
-    """Run a lightweight Claude audit to flag unsupported claims."""
-    context_lines = []
-    for chunk in retrieved_chunks:
-        context_lines.append(
-            f"- ({chunk['resume_type']} | {chunk['source_file']}) {chunk['text']}"
-        )
-    context = "\n".join(context_lines)
+    """Run a lightweight Claude audit to flag unsupported claims.
+
+    Audits are memoized on the resume text and the snippets shown to the auditor, so
+    re-exporting an identical resume skips the LLM call. A reply that wasn't valid JSON
+    is not cached.
+    """
+    context = "\n".join(
+        f"- ({chunk['resume_type']} | {chunk['source_file']}) {chunk['text']}" for chunk in retrieved_chunks
+    )
 
+    key = (
+        hashlib.blake2b(f"{resume_text}\0{context}".encode("utf-8"), digest_size=16).digest(),
+        settings.llm_provider,
+    )
+    with _AUDIT_CACHE_LOCK:
+        cached = _AUDIT_CACHE.get(key)
+        if cached is not None:
+            _AUDIT_CACHE.move_to_end(key)
+            return cached
+
+    audit, degraded = _run_audit(resume_text, context)
+    if not degraded:
+        with _AUDIT_CACHE_LOCK:
+            _AUDIT_CACHE[key] = audit
+            if len(_AUDIT_CACHE) > _AUDIT_CACHE_SIZE:
+                _AUDIT_CACHE.popitem(last=False)
+    return audit
+
+
+def _run_audit(resume_text: str, context: str) -> tuple[ResumeAudit, bool]:
     system_prompt = (
         "You are a strict resume auditor. Return ONLY valid JSON with no extra text."
     )
+    # The snippets lead the prompt so repeat audits against the same retrieval hit the
+    # provider's prompt cache; the resume text varies per call and follows them.
+    context_prefix = f"CONTEXT SNIPPETS:\n{context}\n\n"
+    must_have_terms = ", ".join(settings.audit_must_have_terms)
     user_prompt = (
         f"RESUME:\n{resume_text}\n\n"
-        f"CONTEXT SNIPPETS:\n{context}\n\n"
         "Rules:\n"
         "- Flag any resume claim not directly supported by snippets.\n"
-        "- If resume claims clinical trial lifecycle terms (clinical trial, study, protocol, eCRF/CRF, DMP, DVP, EDC, GCP)\n"
+        f"- If resume claims domain must-have terms ({must_have_terms})\n"
         "  but those terms do NOT appear in snippets, list them under unsupported_claims.\n"
         "- If JD must-haves appear in the resume but are not supported, list them under risky_phrases.\n"
         "- If JD must-have terms are missing from snippets entirely, list them under missing_must_haves.\n\n"
@@ -283,7 +234,7 @@ def _audit_resume(resume_text: str, retrieved_chunks: list[dict]) -> ResumeAudit
         '  "risky_phrases": ["..."],\n'
         '  "missing_must_haves": ["..."]\n'
         '}\n'
-        "JD must-have terms to check: clinical trial, study, protocol, eCRF, CRF, DMP, DVP, EDC, GCP\n"
+        f"JD must-have terms to check: {must_have_terms}\n"
     )
 
     raw = generate_with_llm(
@@ -292,72 +243,60 @@ def _audit_resume(resume_text: str, retrieved_chunks: list[dict]) -> ResumeAudit
         max_tokens=400,
         temperature=0.0,
         provider=settings.llm_provider,
+        cached_prefix=context_prefix,
     )
     unsupported_claims: list[str] = []
     risky_phrases: list[str] = []
     missing_must_haves: list[str] = []
 
-    try:
-        data = json.loads(raw)
+    degraded = False
+
+    data = _parse_audit_reply(raw)
+    if data is not None:
         unsupported_claims = data.get("unsupported_claims", []) or []
         risky_phrases = data.get("risky_phrases", []) or []
         missing_must_haves = data.get("missing_must_haves", []) or []
-    except json.JSONDecodeError:
-        unsupported_claims = []
-        risky_phrases = []
-        missing_must_haves = []
-
-    unsupported_claims = [str(item).strip() for item in unsupported_claims if str(item).strip()]
-    risky_phrases = [str(item).strip() for item in risky_phrases if str(item).strip()]
-    missing_must_haves = [str(item).strip() for item in missing_must_haves if str(item).strip()]
-
-    return ResumeAudit(
-        unsupported_claims=unsupported_claims,
-        risky_phrases=risky_phrases,
-        missing_must_haves=missing_must_haves,
-    )
-
-
-def _parse_bool(value: str) -> bool:
-    return value.strip().lower() == "true"
-
-
-def _recover_payload_from_invalid_json(raw_text: str) -> dict:
-    """Best-effort recovery when JSON contains unescaped newlines."""
-    data: dict = {}
-
-    jd_match = re.search(
-        r'"jd_text"\s*:\s*"(.*)"\s*,\s*"(top_k|multi_query|parse_with_claude|audit|domain_rewrite|target_company_type|bullets_per_role|use_experience_inventory|max_roles)"',
-        raw_text,
-        re.DOTALL,
-    )
-    if jd_match:
-        data["jd_text"] = jd_match.group(1)
     else:
-        data["jd_text"] = raw_text.strip()
-
-    top_k_match = re.search(r'"top_k"\s*:\s*(\d+)', raw_text)
-    if top_k_match:
-        data["top_k"] = int(top_k_match.group(1))
-
-    bullets_match = re.search(r'"bullets_per_role"\s*:\s*(\d+)', raw_text)
-    if bullets_match:
-        data["bullets_per_role"] = int(bullets_match.group(1))
+        degraded = True
 
-    max_roles_match = re.search(r'"max_roles"\s*:\s*(\d+)', raw_text)
-    if max_roles_match:
-        data["max_roles"] = int(max_roles_match.group(1))
-
-    for key in ["multi_query", "parse_with_claude", "audit", "domain_rewrite", "use_experience_inventory"]:
-        match = re.search(rf'"{key}"\s*:\s*(true|false)', raw_text, re.IGNORECASE)
-        if match:
-            data[key] = _parse_bool(match.group(1))
+    audit = ResumeAudit(
+        unsupported_claims=_clean_audit_items(unsupported_claims),
+        risky_phrases=_clean_audit_items(risky_phrases),
+        missing_must_haves=_clean_audit_items(missing_must_haves),
+    )
+    return audit, degraded
 
-    target_match = re.search(r'"target_company_type"\s*:\s*"([^"]*)"', raw_text)
-    if target_match:
-        data["target_company_type"] = target_match.group(1)
 
-    return data
+def _parse_audit_reply(raw: str) -> dict | None:
+    """Decode the auditor's JSON, salvaging replies wrapped in prose or cut off at max_tokens."""
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        start = raw.find("{")
+        if start == -1:
+            return None
+        try:
+            # Partial mode closes a truncated object and ignores anything after a complete one.
+            data = from_json(raw[start:], allow_partial=True)
+        except ValueError:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+def _clean_audit_items(items: list) -> list[str]:
+    return [text for item in items if (text := str(item).strip())]
+
+
+# Identical requests against an unchanged index and resume set reuse the JD parse, retrieval
+# and prompt; the draft, audit and stored record are still produced fresh on every call.
+# (digest of request, provider/models, index and resume signatures) -> prepared generation.
+_PREPARED_CACHE: "OrderedDict[tuple, tuple[str, dict | None, list[dict], list[dict]]]" = OrderedDict()
+_PREPARED_CACHE_SIZE = 32
+_PREPARED_CACHE_LOCK = threading.Lock()
+# Request fields that don't affect retrieval or the prompt.
+_PREPARED_KEY_EXCLUDE = {"audit", "no_cache"}
+# Batch items in flight at once; each holds a worker thread during its LLM calls.
+_BATCH_CONCURRENCY = 4
 
 
 @router.post(
@@ -381,6 +320,7 @@ def _recover_payload_from_invalid_json(raw_text: str) -> dict:
                             "bullets_per_role": {"type": "integer", "default": 15},
                             "use_experience_inventory": {"type": "boolean", "default": True},
                             "max_roles": {"type": ["integer", "null"]},
+                            "no_cache": {"type": "boolean", "default": False},
                         },
                         "required": ["jd_text"],
                     },
@@ -395,40 +335,200 @@ def _recover_payload_from_invalid_json(raw_text: str) -> dict:
                         "bullets_per_role": 15,
                         "use_experience_inventory": True,
                         "max_roles": None,
+                        "no_cache": False,
                     },
                 }
             },
         }
     },
 )
-async def generate(request: Request) -> GenerateResponse:
-    body = await request.body()
-    content_type = request.headers.get("content-type", "")
-    data = {}
-    if body:
-        if "application/json" in content_type:
-            try:
-                data = json.loads(body)
-            except json.JSONDecodeError:
-                text = body.decode("utf-8", errors="ignore")
-                data = _recover_payload_from_invalid_json(text)
-        else:
-            text = body.decode("utf-8", errors="ignore").strip()
-            data = {"jd_text": text}
+async def generate(request: Request) -> Response:
+    req = await read_payload(request, GENERATE_REQUEST_ADAPTER, raw_jd_fallback=True)
+    ensure_dirs()
+
+    if not index_exists(settings.index_dir):
+        raise HTTPException(status_code=400, detail="Index not found. Upload resumes or call /reindex first.")
+
+    return ORJSONResponse(content=await _generate_content(req))
 
+
+@router.post("/generate/batch", response_model=list[GenerateResponse])
+async def generate_batch(request: Request) -> Response:
+    """Generate one resume per JD; items run concurrently and share the process caches."""
+    body = await request.body()
     try:
-        req = GenerateRequest(**data)
+        reqs = GENERATE_BATCH_REQUEST_ADAPTER.validate_json(body)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=exc.errors())
+    ensure_dirs()
 
     if not index_exists(settings.index_dir):
         raise HTTPException(status_code=400, detail="Index not found. Upload resumes or call /reindex first.")
 
-    structured_jd = None
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def run(req: GenerateRequest) -> dict:
+        async with semaphore:
+            return await _generate_content(req)
+
+    return ORJSONResponse(content=await asyncio.gather(*(run(req) for req in reqs)))
+
+
+@router.post("/generate/stream")
+async def generate_stream(request: Request) -> Response:
+    """Server-sent events variant of /generate.
+
+    Emits ``token`` events (JSON-encoded text deltas) while the draft is generated, then
+    a single ``result`` event carrying the same body /generate returns once the draft has
+    been finalized, audited and stored. A generation failure ends the stream with ``error``.
+    """
+    req = await read_payload(request, GENERATE_REQUEST_ADAPTER, raw_jd_fallback=True)
+    ensure_dirs()
+
+    if not index_exists(settings.index_dir):
+        raise HTTPException(status_code=400, detail="Index not found. Upload resumes or call /reindex first.")
+
+    # Retrieval errors surface as regular HTTP errors before the stream opens.
+    user_prompt, structured_jd, retrieved, context_chunks = await _prepare_generation_cached(req)
+
+    async def events() -> AsyncIterator[bytes]:
+        parts: list[str] = []
+        try:
+            async for delta in _iterate_in_thread(
+                lambda: stream_with_llm(
+                    system_prompt=SYSTEM_PROMPT,
+                    user_prompt=user_prompt,
+                    max_tokens=3200,
+                    temperature=0.35,
+                    provider=settings.llm_provider,
+                )
+            ):
+                parts.append(delta)
+                yield _sse_event("token", delta)
+        except Exception as exc:
+            yield _sse_event("error", {"detail": f"LLM generation failed: {exc}"})
+            return
+
+        content = await _complete_generation(
+            req, "".join(parts).strip(), structured_jd, retrieved, context_chunks
+        )
+        yield _sse_event("result", content)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode("ascii") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _iterate_in_thread(make_iterator: Callable[[], Iterator[str]]) -> AsyncIterator[str]:
+    """Drive a blocking iterator in a worker thread and yield its items on the event loop."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+    stop = threading.Event()
+
+    def pump() -> None:
+        try:
+            for item in make_iterator():
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        except Exception as exc:
+            loop.call_soon_threadsafe(queue.put_nowait, exc)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+    worker = asyncio.create_task(asyncio.to_thread(pump))
+    try:
+        while True:
+            item = await queue.get()
+            if item is finished:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # A disconnected client stops the pump at the next delta instead of draining the reply.
+        stop.set()
+        await worker
+
+
+async def _generate_content(req: GenerateRequest) -> dict:
+    """Run the /generate pipeline for one validated request and return the response body."""
+    user_prompt, structured_jd, retrieved, context_chunks = await _prepare_generation_cached(req)
+
+    try:
+        resume_text = await asyncio.to_thread(
+            generate_with_llm,
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            max_tokens=3200,
+            temperature=0.35,
+            provider=settings.llm_provider,
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"LLM generation failed: {exc}")
+
+    return await _complete_generation(req, resume_text, structured_jd, retrieved, context_chunks)
+
+
+def _prepared_cache_key(req: GenerateRequest) -> tuple:
+    return (
+        hashlib.blake2b(
+            req.model_dump_json(exclude=_PREPARED_KEY_EXCLUDE).encode("utf-8"), digest_size=16
+        ).digest(),
+        settings.llm_provider,
+        settings.claude_model,
+        settings.openai_model,
+        index_signature(settings.index_dir),
+        resume_files_signature(settings.resumes_dir),
+    )
+
+
+async def _prepare_generation_cached(req: GenerateRequest) -> tuple[str, dict | None, list[dict], list[dict]]:
+    """``_prepare_generation`` memoized per request and index state.
+
+    ``no_cache`` skips the lookup and refreshes the entry. Cached chunks and the parsed
+    JD are shared between requests; treat them as read-only.
+    """
+    # The signatures stat the index and scan the resumes dir; keep that off the event loop.
+    cache_key = await asyncio.to_thread(_prepared_cache_key, req)
+    if not req.no_cache:
+        with _PREPARED_CACHE_LOCK:
+            cached = _PREPARED_CACHE.get(cache_key)
+            if cached is not None:
+                _PREPARED_CACHE.move_to_end(cache_key)
+                return cached
+
+    prepared = await _prepare_generation(req)
+    with _PREPARED_CACHE_LOCK:
+        _PREPARED_CACHE[cache_key] = prepared
+        _PREPARED_CACHE.move_to_end(cache_key)
+        if len(_PREPARED_CACHE) > _PREPARED_CACHE_SIZE:
+            _PREPARED_CACHE.popitem(last=False)
+    return prepared
+
+
+async def _prepare_generation(req: GenerateRequest) -> tuple[str, dict | None, list[dict], list[dict]]:
+    """Retrieve context and build the generation prompt.
+
+    Returns (user_prompt, structured_jd, retrieved, context_chunks).
+    """
     jd_provider = settings.llm_provider
     jd_api_key = settings.openai_api_key if jd_provider.lower() == "openai" else settings.anthropic_api_key
     jd_model = settings.openai_model if jd_provider.lower() == "openai" else settings.claude_model
 
+    # The inventory scan and master-resume read don't depend on the JD; start them first so
+    # they overlap the JD parse and retrieval.
+    inventory_task = (
+        asyncio.create_task(asyncio.to_thread(extract_experience_inventory, settings.resumes_dir))
+        if req.use_experience_inventory
+        else None
+    )
+    headers_task = asyncio.create_task(asyncio.to_thread(load_master_role_headers, settings.resumes_dir))
+
+    structured_jd = None
     needs_structured = (
         req.multi_query
         or req.parse_with_claude
@@ -436,28 +536,35 @@ async def generate(request: Request) -> GenerateResponse:
         or bool(req.target_company_type)
     )
     if needs_structured:
-        structured_jd = parse_jd(
+        parsed_jd = await asyncio.to_thread(
+            parse_jd,
             jd_text=req.jd_text,
             api_key=jd_api_key,
             model=jd_model,
             use_claude=req.parse_with_claude,
             provider=jd_provider,
-        ).model_dump()
+        )
+        structured_jd = parsed_jd.model_dump()
 
-    retrieved = retrieve_topk(
-        jd_text=req.jd_text,
-        index_dir=settings.index_dir,
-        embed_model_name=settings.embed_model,
-        k=req.top_k,
-        multi_query=req.multi_query,
-        structured_jd=structured_jd,
+    retrieved, role_headers = await asyncio.gather(
+        asyncio.to_thread(
+            retrieve_topk,
+            jd_text=req.jd_text,
+            index_dir=settings.index_dir,
+            embed_model_name=settings.embed_model,
+            k=req.top_k,
+            multi_query=req.multi_query,
+            structured_jd=structured_jd,
+        ),
+        headers_task,
     )
 
     context_chunks = retrieved
     skill_grades = None
     if req.domain_rewrite or req.target_company_type:
-        deduped = dedupe_chunks(retrieved, settings.embed_model)
-        context_chunks = rewrite_chunks(
+        deduped = await asyncio.to_thread(dedupe_chunks, retrieved, settings.embed_model)
+        context_chunks = await asyncio.to_thread(
+            rewrite_chunks,
             deduped,
             structured_jd.get("domain") if structured_jd else None,
             req.target_company_type,
@@ -474,16 +581,7 @@ async def generate(request: Request) -> GenerateResponse:
         ).model_dump()
         skill_grades = grade_skills(structured_for_skills, context_chunks)
 
-    experience_inventory = None
-    if req.use_experience_inventory:
-        experience_inventory = extract_experience_inventory(settings.resumes_dir)
-
-    role_headers = None
-    master_resume = select_master_resume(settings.resumes_dir)
-    if master_resume:
-        master_text = read_text(master_resume)
-        if master_text:
-            role_headers = extract_experience_headers(master_text)
+    experience_inventory = await inventory_task if inventory_task is not None else None
 
     user_prompt = build_user_prompt(
         req.jd_text,
@@ -495,63 +593,83 @@ async def generate(request: Request) -> GenerateResponse:
         role_headers=role_headers,
     )
 
-    try:
-        resume_text = generate_with_llm(
-            system_prompt=SYSTEM_PROMPT,
-            user_prompt=user_prompt,
-            max_tokens=3200,
-            temperature=0.35,
-            provider=settings.llm_provider,
-        )
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"LLM generation failed: {exc}")
+    return user_prompt, structured_jd, retrieved, context_chunks
 
-    parsed_state = None
-    try:
-        parsed_state = parse_resume_text_to_state(resume_text)
-        enforce_outcome_clauses(parsed_state, req.jd_text, structured_jd)
-        resume_text = render_resume_text(parsed_state)
-        resume_text = _polish_resume(resume_text, req.jd_text)
-        resume_text = _postprocess_metrics_and_phrasing(resume_text)
-        resume_text = _sync_skills(resume_text, context_chunks, req.jd_text)
-    except Exception as exc:
-        logger.warning("Outcome enforcement failed: %s", exc)
 
-    audit = _audit_resume(resume_text, retrieved) if req.audit else None
-    resume_text = _strip_tilde_symbols(resume_text)
+async def _complete_generation(
+    req: GenerateRequest,
+    resume_text: str,
+    structured_jd: dict | None,
+    retrieved: list[dict],
+    context_chunks: list[dict],
+) -> dict:
+    """Finalize, audit and store a generated draft; returns the response body."""
+    resume_text = await asyncio.to_thread(
+        _finalize_resume_text, resume_text, req.jd_text, structured_jd, context_chunks
+    )
+
+    # The audit LLM call overlaps with tilde cleanup and persisting the record.
+    audit_task = asyncio.create_task(asyncio.to_thread(_audit_resume, resume_text, retrieved)) if req.audit else None
+    resume_text = strip_tilde_symbols(resume_text)
 
     resume_id = None
     try:
-        # Re-parse after cleanup so stored state/preview matches returned text.
-        state = parse_resume_text_to_state(resume_text)
-        resume_id = _new_resume_id(settings.generated_resumes_dir)
-        init_resume_record(
-            settings.generated_resumes_dir,
-            resume_id,
-            state,
-            resume_text,
-            jd_text=req.jd_text,
-            source="generate",
-        )
+        resume_id = await asyncio.to_thread(_store_generated_resume, resume_text, req.jd_text)
     except Exception as exc:
         logger.warning("Failed to store resume state: %s", exc)
 
-    return GenerateResponse(
-        model=(
+    audit = await audit_task if audit_task is not None else None
+
+    # Retrieved chunks are already plain dicts; project them straight into the JSON body
+    # instead of wrapping each one in a model only to dump it again.
+    content = {
+        "model": (
             settings.claude_model
             if settings.llm_provider.lower() == "anthropic"
             else settings.openai_model
         ),
-        top_k=req.top_k,
-        retrieved=[RetrievedChunk(**r) for r in context_chunks],
-        resume_text=resume_text,
-        audit=audit,
-        resume_id=resume_id,
+        "top_k": req.top_k,
+        "retrieved": [{field: r[field] for field in _RETRIEVED_FIELDS} for r in context_chunks],
+        "resume_text": resume_text,
+        "audit": audit.model_dump() if audit else None,
+        "resume_id": resume_id,
+    }
+    return content
+
+
+def _finalize_resume_text(
+    resume_text: str,
+    jd_text: str,
+    structured_jd: dict | None,
+    context_chunks: list[dict],
+) -> str:
+    try:
+        parsed_state = parse_resume_text_to_state(resume_text)
+        enforce_outcome_clauses(parsed_state, jd_text, structured_jd)
+        resume_text = render_resume_text(parsed_state)
+        resume_text = _polish_resume(resume_text, jd_text)
+        resume_text = _postprocess_metrics_and_phrasing(resume_text)
+        resume_text = _sync_skills(resume_text, context_chunks, jd_text)
+    except Exception as exc:
+        logger.warning("Outcome enforcement failed: %s", exc)
+    return resume_text
+
+
+def _store_generated_resume(resume_text: str, jd_text: str) -> str:
+    # Re-parse after cleanup so stored state/preview matches returned text.
+    state = parse_resume_text_to_state(resume_text)
+    resume_id = _new_resume_id()
+    init_resume_record(
+        settings.generated_resumes_dir,
+        resume_id,
+        state,
+        resume_text,
+        jd_text=jd_text,
+        source="generate",
     )
+    return resume_id
 
 
-def _new_resume_id(root_dir) -> str:
-    while True:
-        candidate = uuid4().hex
-        if not (root_dir / candidate).exists():
-            return candidate
+def _new_resume_id() -> str:
+    # init_resume_record refuses an existing directory, so a collision surfaces as an error.
+    return uuid4().hex
@@ -7,8 +7,7 @@ from app.services.indexing import index_exists
 router = APIRouter()
 
 
-@router.get("/health")
-def health() -> dict:
+def health_payload() -> dict:
     return {
         "status": "ok",
         "index_ready": index_exists(settings.index_dir),
@@ -17,3 +16,9 @@ def health() -> dict:
         "provider": settings.llm_provider,
         "model": get_active_model(),
     }
+
+
+@router.get("/health")
+def health() -> dict:
+    # Normally answered by HealthCheckMiddleware; kept so the route shows up in the OpenAPI docs.
+    return health_payload()
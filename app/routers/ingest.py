@@ -1,13 +1,24 @@
 ﻿from fastapi import APIRouter, UploadFile, File, HTTPException
 from pathlib import Path
+import asyncio
+import os
 import shutil
 
 from app.models.schemas import IngestResponse, TemplateListResponse, ResumeListResponse, DeleteResumeResponse
 from app.services.indexing import build_and_save_index
-from app.config import settings
+from app.config import ensure_dirs, settings
 
 router = APIRouter()
 
+# Large copy buffer: a resume upload is written with a handful of syscalls instead of
+# one per 64 KiB chunk.
+_UPLOAD_COPY_BUFFER = 1024 * 1024
+
+
+def _save_upload(src, dest: Path) -> None:
+    with dest.open("wb") as out:
+        shutil.copyfileobj(src, out, _UPLOAD_COPY_BUFFER)
+
 
 @router.get("/resumes/templates", response_model=TemplateListResponse)
 def list_template_resumes() -> TemplateListResponse:
@@ -32,22 +43,18 @@ def list_uploaded_resumes() -> ResumeListResponse:
     allowed = {".pdf", ".doc", ".docx", ".txt"}
     files: list[str] = []
 
-    for p in root.rglob("*"):
-        if p.is_dir():
-            # skip template folder
-            if p.name.lower() == "template":
-                continue
-            # skip hidden dirs
-            if p.name.startswith('.'):
-                continue
-            continue
-        if p.suffix.lower() not in allowed:
-            continue
-        # skip files inside template folder
-        if any(part.lower() == "template" for part in p.relative_to(root).parts):
-            continue
-        rel_path = str(p.relative_to(root).as_posix())
-        files.append(rel_path)
+    def walk(directory: str, prefix: str) -> None:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    # prune template and hidden dirs before descending
+                    if entry.name.lower() == "template" or entry.name.startswith("."):
+                        continue
+                    walk(entry.path, f"{prefix}{entry.name}/")
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in allowed:
+                    files.append(prefix + entry.name)
+
+    walk(str(root), "")
 
     files.sort()
     return ResumeListResponse(files=files)
@@ -69,6 +76,7 @@ async def upload_resumes(files: list[UploadFile] = File(...)) -> IngestResponse:
     if not files:
         raise HTTPException(status_code=400, detail="No files uploaded.")
 
+    ensure_dirs()
     saved = []
     for f in files:
         suffix = Path(f.filename).suffix.lower()
@@ -76,12 +84,12 @@ async def upload_resumes(files: list[UploadFile] = File(...)) -> IngestResponse:
             raise HTTPException(status_code=400, detail=f"Unsupported file type: {f.filename}")
 
         dest = settings.resumes_dir / Path(f.filename).name
-        with dest.open("wb") as out:
-            shutil.copyfileobj(f.file, out)
+        await asyncio.to_thread(_save_upload, f.file, dest)
         saved.append(dest.name)
 
     try:
-        indexed_chunks, saved_files = build_and_save_index(
+        indexed_chunks, saved_files = await asyncio.to_thread(
+            build_and_save_index,
             resumes_dir=settings.resumes_dir,
             index_dir=settings.index_dir,
             embed_model_name=settings.embed_model,
@@ -94,6 +102,7 @@ async def upload_resumes(files: list[UploadFile] = File(...)) -> IngestResponse:
 
 @router.post("/reindex", response_model=IngestResponse)
 def reindex() -> IngestResponse:
+    ensure_dirs()
     try:
         indexed_chunks, saved_files = build_and_save_index(
             resumes_dir=settings.resumes_dir,
@@ -108,6 +117,7 @@ def reindex() -> IngestResponse:
 
 @router.delete("/resumes/{resume_path:path}", response_model=DeleteResumeResponse)
 def delete_resume(resume_path: str) -> DeleteResumeResponse:
+    ensure_dirs()
     root = settings.resumes_dir
     target = (root / resume_path).resolve()
 
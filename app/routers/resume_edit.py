@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pathlib import Path
 import re
 
 from app.config import settings
+from app.responses import model_response
 from app.models.schemas import (
     BulletEditRequest,
     BulletEditResponse,
@@ -10,6 +11,7 @@ from app.models.schemas import (
     BulletRewriteRequest,
     BulletRewriteResponse,
     ResumeTextReplaceRequest,
+    PathsOut,
 )
 from app.services.resume_store import (
     load_resume_state,
@@ -29,7 +31,7 @@ router = APIRouter()
 
 
 @router.get("/resumes/{resume_id}", response_model=ResumeStateResponse)
-def get_resume(resume_id: str) -> ResumeStateResponse:
+def get_resume(resume_id: str) -> Response:
     try:
         state, version = load_resume_state(settings.generated_resumes_dir, resume_id)
     except FileNotFoundError:
@@ -38,11 +40,13 @@ def get_resume(resume_id: str) -> ResumeStateResponse:
     jd_text = load_latest_jd_text(settings.generated_resumes_dir, resume_id)
     resume_text = load_latest_resume_text(settings.generated_resumes_dir, resume_id)
 
-    return ResumeStateResponse(resume_id=resume_id, version=version, state=state, jd_text=jd_text, resume_text=resume_text)
+    return model_response(
+        ResumeStateResponse.build(resume_id=resume_id, version=version, state=state, jd_text=jd_text, resume_text=resume_text)
+    )
 
 
 @router.post("/resumes/{resume_id}/replace-text")
-def replace_resume_text(resume_id: str, payload: ResumeTextReplaceRequest) -> ResumeStateResponse:
+def replace_resume_text(resume_id: str, payload: ResumeTextReplaceRequest) -> Response:
     """Replace entire resume text (preview edits) and store as new version without touching bullets."""
     text = payload.resume_text.strip()
     if len(text) < 20:
@@ -61,12 +65,14 @@ def replace_resume_text(resume_id: str, payload: ResumeTextReplaceRequest) -> Re
     )
     version = meta.get("latest_version")
     jd_text = payload.jd_text or load_latest_jd_text(settings.generated_resumes_dir, resume_id)
-    return ResumeStateResponse(
-        resume_id=resume_id,
-        version=version,
-        state=state,
-        jd_text=jd_text,
-        resume_text=text,
+    return model_response(
+        ResumeStateResponse.build(
+            resume_id=resume_id,
+            version=version,
+            state=state,
+            jd_text=jd_text,
+            resume_text=text,
+        )
     )
 
 
@@ -123,16 +129,16 @@ def edit_bullet(resume_id: str, payload: BulletEditRequest) -> BulletEditRespons
             "dates": role.dates,
         },
         updated_bullet_index=payload.bullet_index,
-        paths={
-            "resume_json": str((version_dir / "resume.json").as_posix()),
-            "resume_docx": str(resume_docx_path.as_posix()) if resume_docx_path else None,
-        },
+        paths=PathsOut.build(
+            resume_json=str((version_dir / "resume.json").as_posix()),
+            resume_docx=str(resume_docx_path.as_posix()) if resume_docx_path else None,
+        ),
     )
 
 
 
 @router.post("/resumes/{resume_id}/rewrite-bullet", response_model=BulletRewriteResponse)
-def rewrite_bullet(resume_id: str, payload: BulletRewriteRequest) -> BulletRewriteResponse:
+def rewrite_bullet(resume_id: str, payload: BulletRewriteRequest) -> Response:
     try:
         state, _ = load_resume_state(settings.generated_resumes_dir, resume_id)
     except FileNotFoundError:
@@ -203,12 +209,14 @@ def rewrite_bullet(resume_id: str, payload: BulletRewriteRequest) -> BulletRewri
             jd_text,
         )
 
-    return BulletRewriteResponse(
-        resume_id=resume_id,
-        role_id=role.role_id,
-        bullet_index=payload.bullet_index,
-        original_bullet=original_bullet,
-        rewritten_bullet=cleaned,
+    return model_response(
+        BulletRewriteResponse.build(
+            resume_id=resume_id,
+            role_id=role.role_id,
+            bullet_index=payload.bullet_index,
+            original_bullet=original_bullet,
+            rewritten_bullet=cleaned,
+        )
     )
 
 
@@ -10,11 +10,15 @@ from app.models.schemas import (
     SuggestPatchesRequest,
     SuggestPatchesResponse,
     PatchOperation,
+    InsertExperiencePatch,
+    InsertSkillsPatch,
+    ReplaceSkillsPatch,
     ApplyPatchesRequest,
     ApplyPatchesResponse,
     IncludeSkillsRequest,
     IncludeSkillsResponse,
     OverrideSkill,
+    PathsOut,
 )
 from app.services.resume_store import load_latest_state, append_resume_version, update_version_docx_path, load_latest_jd_text
 from app.services.resume_overrides import save_overrides, load_overrides
@@ -82,10 +86,8 @@ def suggest_patches(resume_id: str, payload: SuggestPatchesRequest) -> SuggestPa
                             jd_text=payload.jd_text,
                         )
                     suggested.append(
-                        PatchOperation(
+                        InsertExperiencePatch(
                             role_id=role_id,
-                            section="experience",
-                            action="insert",
                             after_index=len(role.bullets) - 1,
                             new_bullet=rewritten,
                             skill=skill,
@@ -111,9 +113,7 @@ def suggest_patches(resume_id: str, payload: SuggestPatchesRequest) -> SuggestPa
             continue
 
         suggested.append(
-            PatchOperation(
-                section="technical_skills",
-                action="insert",
+            InsertSkillsPatch(
                 after_index=len(state.sections.technical_skills) - 1,
                 new_bullet=f"Exposure to {skill}",
                 skill=skill,
@@ -166,10 +166,10 @@ def apply_patches(resume_id: str, payload: ApplyPatchesRequest) -> ApplyPatchesR
     return ApplyPatchesResponse(
         resume_id=resume_id,
         version=version,
-        paths={
-            "resume_json": str((version_dir / "resume.json").as_posix()),
-            "resume_docx": str(resume_docx_path.as_posix()) if resume_docx_path else None,
-        },
+        paths=PathsOut.build(
+            resume_json=str((version_dir / "resume.json").as_posix()),
+            resume_docx=str(resume_docx_path.as_posix()) if resume_docx_path else None,
+        ),
     )
 
 
@@ -249,10 +249,10 @@ def include_skills(resume_id: str, payload: IncludeSkillsRequest) -> IncludeSkil
         resume_id=resume_id,
         version=version,
         applied_patches=suggested,
-        paths={
-            "resume_json": str((version_dir / "resume.json").as_posix()),
-            "resume_docx": str(resume_docx_path.as_posix()) if resume_docx_path else None,
-        },
+        paths=PathsOut.build(
+            resume_json=str((version_dir / "resume.json").as_posix()),
+            resume_docx=str(resume_docx_path.as_posix()) if resume_docx_path else None,
+        ),
         state=state,
         blocked=blocked,
     )
@@ -374,10 +374,8 @@ def _build_patches_from_overrides(
                         jd_text=jd_text,
                     )
                 suggested.append(
-                    PatchOperation(
+                    InsertExperiencePatch(
                         role_id=role_id,
-                        section="experience",
-                        action="insert",
                         after_index=len(role.bullets) - 1,
                         new_bullet=rewritten,
                         skill=skill,
@@ -400,9 +398,7 @@ def _build_technical_skill_patch(state, skill: str, lines_override: list[str] |
     """Insert skill into the best matching technical skills category."""
     lines = lines_override if lines_override is not None else (state.sections.technical_skills or [])
     if not lines:
-        return PatchOperation(
-            section="technical_skills",
-            action="insert",
+        return InsertSkillsPatch(
             after_index=-1,
             new_bullet=f"Other Skills: {skill.strip()}",
             skill=skill,
@@ -414,27 +410,21 @@ def _build_technical_skill_patch(state, skill: str, lines_override: list[str] |
         idx = other_idx
 
     if idx is None:
-        return PatchOperation(
-            section="technical_skills",
-            action="insert",
+        return InsertSkillsPatch(
             after_index=len(lines) - 1,
             new_bullet=f"Other Skills: {skill.strip()}",
             skill=skill,
         )
 
     if idx < 0 or idx >= len(lines):
-        return PatchOperation(
-            section="technical_skills",
-            action="insert",
+        return InsertSkillsPatch(
             after_index=len(lines) - 1,
             new_bullet=f"Other Skills: {skill.strip()}",
             skill=skill,
         )
 
     if idx is None or not isinstance(idx, int):
-        return PatchOperation(
-            section="technical_skills",
-            action="insert",
+        return InsertSkillsPatch(
             after_index=len(lines) - 1,
             new_bullet=f"Other Skills: {skill.strip()}",
             skill=skill,
@@ -444,9 +434,7 @@ def _build_technical_skill_patch(state, skill: str, lines_override: list[str] |
     if not updated or updated == lines[idx]:
         return None
 
-    return PatchOperation(
-        section="technical_skills",
-        action="replace",
+    return ReplaceSkillsPatch(
         bullet_index=int(idx),
         new_bullet=updated,
         skill=skill,
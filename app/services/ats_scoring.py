@@ -144,7 +144,7 @@ def score_resume_against_jd(
     missing_required = [item.skill for item in req_coverage if item.status == "missing"]
     missing_preferred = [item.skill for item in pref_coverage if item.status == "missing"]
 
-    return AtsScoreResponse(
+    return AtsScoreResponse.build(
         ats_score=final_score,
         keyword_score=keyword_score,
         role_score=role_score,
@@ -1,7 +1,18 @@
-﻿from anthropic import Anthropic
+﻿from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+# One client per key: the SDK's pooled HTTP connections then stay alive across calls
+# instead of paying a fresh TLS handshake per request. The client is thread-safe.
+@lru_cache(maxsize=4)
+def get_client(api_key: str) -> "Anthropic":
+    from anthropic import Anthropic
 
-def get_client(api_key: str) -> Anthropic:
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY is missing. Set it in .env.")
     return Anthropic(api_key=api_key)
@@ -14,15 +25,29 @@ def generate_with_claude(
     user_prompt: str,
     max_tokens: int = 1400,
     temperature: float = 0.2,
+    cached_prefix: str | None = None,
 ) -> str:
+    """Send one user turn to Claude.
+
+    The system prompt is marked for prompt caching, as is ``cached_prefix`` when given:
+    a stable leading block of the user turn that precedes the per-request ``user_prompt``.
+    Blocks below the model's minimum cacheable length are simply sent uncached.
+    """
     client = get_client(api_key)
 
+    user_content: str | list[dict] = user_prompt
+    if cached_prefix:
+        user_content = [
+            {"type": "text", "text": cached_prefix, "cache_control": _EPHEMERAL},
+            {"type": "text", "text": user_prompt},
+        ]
+
     msg = client.messages.create(
         model=model,
         max_tokens=max_tokens,
         temperature=temperature,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
+        system=[{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}],
+        messages=[{"role": "user", "content": user_content}],
     )
 
     out = []
@@ -30,3 +55,24 @@ def generate_with_claude(
         if getattr(block, "type", None) == "text":
             out.append(block.text)
     return "\n".join(out).strip()
+
+
+def stream_with_claude(
+    api_key: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 1400,
+    temperature: float = 0.2,
+) -> Iterator[str]:
+    """Yield Claude's reply as text deltas while it is generated."""
+    client = get_client(api_key)
+
+    with client.messages.stream(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        system=[{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}],
+        messages=[{"role": "user", "content": user_prompt}],
+    ) as stream:
+        yield from stream.text_stream
@@ -1,5 +1,7 @@
-﻿from pathlib import Path
+﻿from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List
+import io
 import logging
 import re
 import tempfile
@@ -41,12 +43,15 @@ _MAX_DOCX_BYTES = 1_800_000
 logger = logging.getLogger(__name__)
 
 
+# Drop path-reserved characters and turn spaces into underscores in one C-level pass.
+_SANITIZE_TABLE = str.maketrans({" ": "_", **dict.fromkeys('\\/:*?"<>|')})
+
+
 def sanitize_name(name: str) -> str:
     """Sanitize a string for filesystem-safe paths."""
-    cleaned = re.sub(r"[\\/:*?\"<>|]", "", name)
-    cleaned = cleaned.replace(" ", "_")
-    cleaned = re.sub(r"_+", "_", cleaned)
-    return cleaned.strip("_") or "UNKNOWN"
+    cleaned = name.translate(_SANITIZE_TABLE)
+    # Collapse underscore runs and trim them from both ends.
+    return "_".join(part for part in cleaned.split("_") if part) or "UNKNOWN"
 
 
 def build_output_paths(company_name: str, position_name: str, job_id: str | None) -> Path:
@@ -245,9 +250,19 @@ def _optimize_docx_file(docx_path: Path, max_bytes: int = _MAX_DOCX_BYTES) -> No
 
 
 
+@lru_cache(maxsize=4)
+def _read_template_bytes(template_path: str, mtime_ns: int) -> bytes:
+    return Path(template_path).read_bytes()
+
+
+def load_template_bytes(template_path: Path) -> bytes:
+    """Return the template file's bytes, re-reading only when its mtime changes."""
+    return _read_template_bytes(str(template_path), template_path.stat().st_mtime_ns)
+
+
 def export_resume_to_docx(template_path: Path, sections: Dict[str, List[str]], output_path: Path) -> None:
     """Render resume sections into the DOCX template and save it."""
-    doc = Document(template_path)
+    doc = Document(io.BytesIO(load_template_bytes(template_path)))
     _relocate_education_block(doc)
     _ensure_blank_before_education(doc)
 
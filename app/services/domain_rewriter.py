@@ -1,8 +1,7 @@
 ﻿from typing import List, Optional, Dict
 import re
 
-from sentence_transformers import SentenceTransformer
-import numpy as np
+from app.services.embeddings import get_embedder
 
 
 _DOMAIN_MAP = {
@@ -130,7 +129,9 @@ def dedupe_chunks(
     if not chunks:
         return chunks
 
-    model = SentenceTransformer(embed_model_name)
+    import numpy as np
+
+    model = get_embedder(embed_model_name)
     texts = [item.get("text", "") for item in chunks]
     embeddings = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True).astype(np.float32)
 
@@ -0,0 +1,13 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
+@lru_cache(maxsize=2)
+def get_embedder(embed_model_name: str) -> "SentenceTransformer":
+    """Load an embedding model once per process and share it across requests."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(embed_model_name)
@@ -2,7 +2,7 @@ from pathlib import Path
 import re
 from typing import Dict, List, Optional
 
-from app.services.parsing import read_text, normalize, SUPPORTED
+from app.services.parsing import read_text, normalize, resume_files_signature, SUPPORTED
 
 _SECTION_HEADERS = {
     "PROFESSIONAL EXPERIENCE": "experience",
@@ -17,8 +17,27 @@ _MONTH_RE = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\s+\
 _DATE_RANGE_RE = re.compile(rf"({_MONTH_RE})\s*(?:-|to)\s*(Present|Current|{_MONTH_RE})", re.IGNORECASE)
 
 
+# resumes_dir -> (resume_files_signature, inventory); the inventory is shared, treat it as read-only.
+_INVENTORY_CACHE: Dict[str, tuple] = {}
+
+
 def extract_experience_inventory(resumes_dir: Path) -> Dict:
-    """Extract education lines and role bullets from resumes in the directory."""
+    """Extract education lines and role bullets from resumes in the directory.
+
+    Cached until a supported file in the directory is added, removed or modified.
+    """
+    signature = resume_files_signature(resumes_dir)
+    key = str(resumes_dir)
+    cached = _INVENTORY_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    inventory = _build_inventory(resumes_dir)
+    _INVENTORY_CACHE[key] = (signature, inventory)
+    return inventory
+
+
+def _build_inventory(resumes_dir: Path) -> Dict:
     roles: List[Dict] = []
     education_lines: List[str] = []
 
@@ -1,10 +1,7 @@
 ﻿import json
 from pathlib import Path
 
-import faiss
-import numpy as np
-from sentence_transformers import SentenceTransformer
-
+from app.services.embeddings import get_embedder
 from app.services.parsing import (
     read_text,
     normalize,
@@ -19,7 +16,11 @@ def build_and_save_index(
     index_dir: Path,
     embed_model_name: str,
 ) -> tuple[int, list[str]]:
-    model = SentenceTransformer(embed_model_name)
+    # Heavy ML imports stay local so importing this module (e.g. for index_exists) is cheap.
+    import faiss
+    import numpy as np
+
+    model = get_embedder(embed_model_name)
 
     metas: list[dict] = []
     texts: list[str] = []
@@ -66,3 +67,16 @@ def build_and_save_index(
 
 def index_exists(index_dir: Path) -> bool:
     return (index_dir / "faiss.index").exists() and (index_dir / "meta.jsonl").exists()
+
+
+def index_signature(index_dir: Path) -> tuple:
+    """(mtime_ns, size) of the index files; changes whenever the index is rebuilt."""
+    signature = []
+    for name in ("faiss.index", "meta.jsonl"):
+        try:
+            stat = (index_dir / name).stat()
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
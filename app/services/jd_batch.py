@@ -0,0 +1,138 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.models.schemas import JDParseResponse
+from app.services.jd_parser import parse_jd
+
+logger = logging.getLogger(__name__)
+
+# (jd_text, api_key, model, provider) identifies one parse; identical requests share a result.
+_ParseKey = tuple[str, str, str, Optional[str]]
+
+
+class JDParseBatcher:
+    """Coalesce JD parse requests that arrive within a short window.
+
+    Requests are queued and drained in batches of up to ``max_batch`` items or
+    ``window`` seconds. Identical JDs in a batch share a single LLM call, and
+    distinct JDs are parsed concurrently in worker threads. Each batch is
+    dispatched as its own task, so collecting the next window never waits on
+    the LLM calls of the previous one.
+    """
+
+    def __init__(self, max_batch: int = 16, window: float = 0.025) -> None:
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Dispatch tasks still running; held here so they aren't garbage-collected mid-flight.
+        self._dispatching: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop collecting; undispatched requests fail, dispatched batches run to completion."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        queue, self._queue = self._queue, None
+        while not queue.empty():
+            _fail_stopped(queue.get_nowait())
+
+        # The parse threads can't be interrupted, so let their batches deliver results.
+        if self._dispatching:
+            await asyncio.gather(*self._dispatching, return_exceptions=True)
+
+    async def submit(
+        self,
+        jd_text: str,
+        api_key: str,
+        model: str,
+        provider: Optional[str] = None,
+    ) -> JDParseResponse:
+        key: _ParseKey = (jd_text, api_key, model, provider)
+        if not self.running:
+            return await asyncio.to_thread(_parse, key)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((key, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Stopped mid-window: nothing will dispatch the requests collected so far.
+                for item in batch:
+                    _fail_stopped(item)
+                raise
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch: list[tuple[_ParseKey, asyncio.Future]]) -> None:
+        waiters: dict[_ParseKey, list[asyncio.Future]] = {}
+        for key, future in batch:
+            waiters.setdefault(key, []).append(future)
+
+        keys = list(waiters)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_parse, key) for key in keys),
+            return_exceptions=True,
+        )
+        if len(keys) < len(batch):
+            logger.info("JD parse batch: %d requests, %d unique", len(batch), len(keys))
+
+        for key, result in zip(keys, results):
+            for future in waiters[key]:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+def _fail_stopped(item: tuple[_ParseKey, asyncio.Future]) -> None:
+    future = item[1]
+    if not future.done():
+        future.set_exception(RuntimeError("JD parse batcher stopped before the request was dispatched"))
+
+
+def _parse(key: _ParseKey) -> JDParseResponse:
+    jd_text, api_key, model, provider = key
+    return parse_jd(
+        jd_text=jd_text,
+        api_key=api_key,
+        model=model,
+        use_claude=True,
+        provider=provider,
+    )
+
+
+jd_batcher = JDParseBatcher()
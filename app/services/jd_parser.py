@@ -1,6 +1,8 @@
-﻿import json
+﻿import hashlib
+import json
 import re
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from typing import Optional
 
 from app.models.schemas import JDParseResponse
@@ -111,6 +113,13 @@ def _fallback_parse(jd_text: str) -> dict:
     }
 
 
+# Parsed JDs keyed by (blake2b(jd_text), use_claude, provider, model). JDParseResponse is frozen,
+# so cached instances are shared as-is; callers that need a dict call model_dump().
+_PARSE_CACHE: "OrderedDict[tuple, JDParseResponse]" = OrderedDict()
+_PARSE_CACHE_SIZE = 256
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
 def parse_jd(
     jd_text: str,
     api_key: str,
@@ -118,7 +127,40 @@ def parse_jd(
     use_claude: bool = True,
     provider: str | None = None,
 ) -> JDParseResponse:
-    """Parse a JD into structured fields using Claude with a rule-based fallback."""
+    """Parse a JD into structured fields using Claude with a rule-based fallback.
+
+    Results are memoized per JD text and parser settings, so repeat exports of the
+    same JD skip the LLM call. An LLM failure that fell back to the rule-based
+    parser is not cached, so the next call retries the LLM.
+    """
+    key = (
+        hashlib.blake2b(jd_text.encode("utf-8"), digest_size=16).digest(),
+        use_claude,
+        provider,
+        model if use_claude else None,
+    )
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return cached
+
+    result, degraded = _parse_jd_uncached(jd_text, model, use_claude, provider)
+    if not degraded:
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = result
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    return result
+
+
+def _parse_jd_uncached(
+    jd_text: str,
+    model: str,
+    use_claude: bool,
+    provider: str | None,
+) -> tuple[JDParseResponse, bool]:
+    degraded = False
     if use_claude:
         system_prompt = (
             "You are a strict JSON extraction engine. "
@@ -148,6 +190,7 @@ def parse_jd(
             data = json.loads(raw)
         except Exception:
             data = _fallback_parse(jd_text)
+            degraded = True
     else:
         data = _fallback_parse(jd_text)
 
@@ -160,4 +203,4 @@ def parse_jd(
         "responsibilities": _normalize_list(data.get("responsibilities", [])),
     }
 
-    return JDParseResponse(**normalized)
+    return JDParseResponse(**normalized), degraded
@@ -1,6 +1,8 @@
+from typing import Iterator
+
 from app.config import settings
-from app.services.claude_client import generate_with_claude
-from app.services.openai_client import generate_with_openai
+from app.services.claude_client import generate_with_claude, stream_with_claude
+from app.services.openai_client import generate_with_openai, stream_with_openai
 
 
 def _normalized_provider(provider: str | None) -> str:
@@ -24,14 +26,20 @@ def generate_with_llm(
     temperature: float = 0.2,
     provider: str | None = None,
     model: str | None = None,
+    cached_prefix: str | None = None,
 ) -> str:
+    """Generate text with the configured provider.
+
+    ``cached_prefix`` is a stable leading part of the user prompt. Claude gets it as a
+    separately cached block; OpenAI caches prompt prefixes on its own, so it is prepended.
+    """
     provider_name = _normalized_provider(provider)
     if provider_name == "openai":
         return generate_with_openai(
             api_key=settings.openai_api_key,
             model=model or settings.openai_model,
             system_prompt=system_prompt,
-            user_prompt=user_prompt,
+            user_prompt=(cached_prefix or "") + user_prompt,
             max_tokens=max_tokens,
             temperature=temperature,
             base_url=settings.openai_base_url or None,
@@ -44,4 +52,36 @@ def generate_with_llm(
         user_prompt=user_prompt,
         max_tokens=max_tokens,
         temperature=temperature,
+        cached_prefix=cached_prefix,
+    )
+
+
+def stream_with_llm(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 1400,
+    temperature: float = 0.2,
+    provider: str | None = None,
+    model: str | None = None,
+) -> Iterator[str]:
+    """Like generate_with_llm, but yields the reply as text deltas."""
+    provider_name = _normalized_provider(provider)
+    if provider_name == "openai":
+        return stream_with_openai(
+            api_key=settings.openai_api_key,
+            model=model or settings.openai_model,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            base_url=settings.openai_base_url or None,
+        )
+
+    return stream_with_claude(
+        api_key=settings.anthropic_api_key,
+        model=model or settings.claude_model,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        max_tokens=max_tokens,
+        temperature=temperature,
     )
@@ -3,7 +3,7 @@ from typing import Optional, List
 import re
 import random
 
-from app.services.parsing import read_text, normalize, SUPPORTED
+from app.services.parsing import read_text, normalize, resume_files_signature, SUPPORTED
 
 _MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December)"
 _MONTH_YEAR = rf"{_MONTH}\s+\d{{4}}"
@@ -11,6 +11,31 @@ _DATE_RANGE_RE = re.compile(rf"({_MONTH_YEAR})\s*(?:-|\u2013|to)\s*(Present|Curr
 _BULLET_RE = re.compile(r"^(?:[-*\u2022]|\d+\.)\s+")
 
 
+# resumes_dir -> (resume_files_signature, role headers of the selected master resume)
+_MASTER_HEADERS_CACHE: dict[str, tuple[tuple, Optional[List[str]]]] = {}
+
+
+def load_master_role_headers(resumes_dir: Path) -> Optional[List[str]]:
+    """
+    Role headers of the master resume, recomputed only when a resume file is
+    added, removed or modified (selection reads every resume, so any change counts).
+    """
+    signature = resume_files_signature(resumes_dir)
+    key = str(resumes_dir)
+    cached = _MASTER_HEADERS_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    headers = None
+    master_resume = select_master_resume(resumes_dir)
+    if master_resume:
+        master_text = read_text(master_resume)
+        if master_text:
+            headers = extract_experience_headers(master_text)
+    _MASTER_HEADERS_CACHE[key] = (signature, headers)
+    return headers
+
+
 def select_master_resume(resumes_dir: Path) -> Optional[Path]:
     """
     Picks the master resume automatically.
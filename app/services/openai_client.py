@@ -1,11 +1,18 @@
-from openai import OpenAI
 import logging
 import traceback
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
 
-def get_client(api_key: str, base_url: str | None = None, timeout: float = 120.0) -> OpenAI:
+@lru_cache(maxsize=4)
+def get_client(api_key: str, base_url: str | None = None, timeout: float = 120.0) -> "OpenAI":
+    from openai import OpenAI
+
     if not api_key:
         raise ValueError("OPENAI_API_KEY is missing. Set it in .env.")
     if base_url is not None:
@@ -151,6 +158,39 @@ def generate_with_openai(
         _raise_openai_error(exc)
  
  
+def stream_with_openai(
+    api_key: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 1400,
+    temperature: float = 0.2,
+    base_url: str | None = None,
+) -> Iterator[str]:
+    """Yield the chat completion as text deltas while it is generated."""
+    client = get_client(api_key=api_key, base_url=base_url)
+    chat_params = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        "stream": True,
+    }
+    if model.startswith("gpt-5"):
+        chat_params["max_completion_tokens"] = max(max_tokens, 4000)
+    else:
+        chat_params["max_tokens"] = max_tokens
+        if temperature is not None:
+            chat_params["temperature"] = temperature
+    try:
+        for chunk in client.chat.completions.create(**chat_params):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except Exception as exc:
+        _raise_openai_error(exc)
+
+
 def _raise_openai_error(exc: Exception) -> None:
     logger.error("OpenAI request failed: %s", exc)
     logger.error("OpenAI traceback:\n%s", traceback.format_exc())
@@ -1,22 +1,44 @@
 ﻿from pathlib import Path
+import os
 import re
 
-import pdfplumber
-import docx
-
 SUPPORTED = {".pdf", ".docx", ".txt"}
 
 
+def resume_files_signature(resumes_dir: Path) -> tuple:
+    """Cheap fingerprint of the supported files directly under ``resumes_dir``.
+
+    One ``scandir`` pass yielding (name, mtime_ns, size) per file; services use it
+    as a cache key for results derived from reading every resume.
+    """
+    entries = []
+    try:
+        with os.scandir(resumes_dir) as it:
+            for entry in it:
+                if os.path.splitext(entry.name)[1].lower() not in SUPPORTED or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except FileNotFoundError:
+        pass
+    entries.sort()
+    return tuple(entries)
+
+
 def read_text(path: Path) -> str:
     suffix = path.suffix.lower()
     if suffix == ".txt":
         return path.read_text(encoding="utf-8", errors="ignore")
 
     if suffix == ".docx":
+        import docx
+
         d = docx.Document(str(path))
         return "\n".join(p.text for p in d.paragraphs)
 
     if suffix == ".pdf":
+        import pdfplumber
+
         parts = []
         with pdfplumber.open(str(path)) as pdf:
             for page in pdf.pages:
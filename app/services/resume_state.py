@@ -43,9 +43,9 @@ def parse_resume_text_to_state(resume_text: str) -> ResumeState:
 
     education = sections.get("education", [])
 
-    return ResumeState(
+    return ResumeState.build(
         header=header,
-        sections=ResumeSections(
+        sections=ResumeSections.build(
             professional_summary=summary,
             technical_skills=skills,
             experience=roles,
@@ -130,7 +130,7 @@ def _parse_header_lines(lines: List[str]) -> ResumeHeader:
     name = lines[0] if len(lines) >= 1 else None
     location_line = lines[1] if len(lines) >= 2 else None
     contact_line = " | ".join(lines[2:]) if len(lines) >= 3 else None
-    return ResumeHeader(name=name, location_line=location_line, contact_line=contact_line)
+    return ResumeHeader.build(name=name, location_line=location_line, contact_line=contact_line)
 
 
 def _extract_sections(lines: List[str]) -> Dict[str, List[str]]:
@@ -192,7 +192,7 @@ def _parse_experience_roles(lines: List[str]) -> List[ExperienceRole]:
 
     if not roles and fallback_bullets:
         roles.append(
-            ExperienceRole(
+            ExperienceRole.build(
                 role_id=_role_id("Unknown", "Unknown Role", None),
                 company="Unknown",
                 title="Unknown Role",
@@ -207,7 +207,7 @@ def _parse_experience_roles(lines: List[str]) -> List[ExperienceRole]:
 
 def _to_role(raw: Dict) -> ExperienceRole:
     role_id = _role_id(raw.get("company"), raw.get("title"), raw.get("dates"))
-    return ExperienceRole(
+    return ExperienceRole.build(
         role_id=role_id,
         company=raw.get("company", "Unknown"),
         title=raw.get("title"),
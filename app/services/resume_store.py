@@ -20,7 +20,7 @@ def init_resume_record(
 ) -> Dict[str, Any]:
     """Create a new resume record with version v1."""
     resume_dir = root_dir / resume_id
-    resume_dir.mkdir(parents=True, exist_ok=True)
+    resume_dir.mkdir(parents=True, exist_ok=False)
     version = "v1"
     version_dir = resume_dir / version
     version_dir.mkdir(parents=True, exist_ok=True)
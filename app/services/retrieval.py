@@ -3,9 +3,7 @@ from pathlib import Path
 import re
 from typing import Optional
 
-import faiss
-import numpy as np
-from sentence_transformers import SentenceTransformer
+from app.services.embeddings import get_embedder
 
 
 def _load_meta(meta_path: Path) -> list[dict]:
@@ -64,13 +62,16 @@ def retrieve_topk(
     per_query_k: int = 10,
 ) -> list[dict]:
     """Retrieve top-k chunks with optional multi-query retrieval and support tagging."""
+    import faiss
+    import numpy as np
+
     index_path = index_dir / "faiss.index"
     meta_path = index_dir / "meta.jsonl"
 
     index = faiss.read_index(str(index_path))
     metas = _load_meta(meta_path)
 
-    model = SentenceTransformer(embed_model_name)
+    model = get_embedder(embed_model_name)
 
     keyword_pool = _keywords_from_structured(structured_jd)
     if not keyword_pool:
@@ -0,0 +1,76 @@
+import re
+
+# Metric limiter and phrasing de-dupe patterns shared by /generate and the export routes.
+_END_CLIP = re.compile(r"(by\s+~?\d+%|by\s+~?\d+\s*(ms|s|minutes|hours)|by\s+~?\d+\s*(requests|users|pipelines))", re.IGNORECASE)
+_METRIC_RANGE = re.compile(
+    r"~?\d+(?:\.\d+)?\s*[–-]\s*~?\d+(?:\.\d+)?\s*(%|ms|s|sec|seconds|minutes|hours)",
+    re.IGNORECASE,
+)
+METRIC_TOKEN = re.compile(
+    r"~?\d+(?:\.\d+)?\s*(%|ms|s|sec|seconds|minutes|hours|x|times|tps|rps|req/s|requests/sec|requests/s|users|pipelines|jobs|tickets|incidents)",
+    re.IGNORECASE,
+)
+DANGLING_METRIC = re.compile(r"\bby\s+~%|\b~%|~–%", re.IGNORECASE)
+DANGLING_ESTIMATE = re.compile(
+    r"\b(using\s+estimated|using\s+an?\s+estimated|by\s+estimated|by\s+an?\s+estimated)\b(?!\s*~?\d)",
+    re.IGNORECASE,
+)
+LONE_ESTIMATE = re.compile(r"\bestimated\b(?!\s*~?\d)", re.IGNORECASE)
+TILDE_NO_NUMBER = re.compile(r"~\s*(%|ms|s|sec|seconds|minutes|hours)\b", re.IGNORECASE)
+PARENS = re.compile(r"\(([^()]+)\)")
+_P_RESPONSE_TIMES = re.compile(r"\bp\s+response\s+times\b", re.IGNORECASE)
+_P_RESPONSE = re.compile(r"\bp\s+response\b", re.IGNORECASE)
+_S_TRIGGERS = re.compile(r"\band\s+S\s+triggers\b", re.IGNORECASE)
+_HEDGE_WORDS = re.compile(r"\b(estimated|likely|approximately|about)\b", re.IGNORECASE)
+
+
+def _fuse_patterns(*named: tuple[str, re.Pattern]) -> re.Pattern:
+    # Leftmost match wins, and earlier alternatives take precedence at the same position.
+    return re.compile("|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in named), re.IGNORECASE)
+
+
+# The per-bullet cleanup subs fused into two scans. Removals run first and can join words
+# (e.g. "p estimated response"), so the renames need their own pass over the result.
+BULLET_REMOVALS = _fuse_patterns(
+    ("dang_est", DANGLING_ESTIMATE),
+    ("lone_est", LONE_ESTIMATE),
+    ("dang_met", DANGLING_METRIC),
+    ("tilde_nn", TILDE_NO_NUMBER),
+)
+BULLET_REWRITES = _fuse_patterns(
+    ("p_rt", _P_RESPONSE_TIMES),
+    ("p_r", _P_RESPONSE),
+    ("s_trig", _S_TRIGGERS),
+    ("hedge", _HEDGE_WORDS),
+)
+_BULLET_REWRITE_REPLACEMENTS = {
+    "p_rt": "p95 response times",
+    "p_r": "p95 response",
+    "s_trig": "and S3 triggers",
+    "hedge": "",
+}
+# Any of the three metric shapes; one search instead of up to three per bullet.
+_ANY_METRIC = _fuse_patterns(
+    ("end_clip", _END_CLIP),
+    ("range", _METRIC_RANGE),
+    ("token", METRIC_TOKEN),
+)
+LEAD_BULLET = re.compile(r"^\s*[-*\u2022]\s*")
+MULTI_SPACE = re.compile(r"\s{2,}")
+TRAILING_BY = re.compile(r"\s+by\s*$", re.IGNORECASE)
+QUALITATIVE_STEMS = ("reliab", "stabil", "quality", "accuracy", "freshness", "risk", "uptime", "sla")
+MAX_METRICS_PER_ROLE = 6  # cap metrics; excess will be converted to qualitative outcomes
+_TILDE_TABLE = str.maketrans(dict.fromkeys("~∼˜～"))
+
+
+def bullet_rewrite_repl(match: re.Match) -> str:
+    """Replacement callback for ``BULLET_REWRITES.sub``."""
+    return _BULLET_REWRITE_REPLACEMENTS[match.lastgroup]
+
+
+def strip_tilde_symbols(text: str) -> str:
+    return text.translate(_TILDE_TABLE)
+
+
+def line_has_metric(line: str) -> bool:
+    return _ANY_METRIC.search(line) is not None
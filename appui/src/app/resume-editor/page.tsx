@@ -158,8 +158,8 @@ export default function ResumeEditorPage() {
       setError(res.error);
       return;
     }
-    const { final_resume_docx_path, resume_docx_path } = res.data;
-    const targetPath = final_resume_docx_path || resume_docx_path;
+    const { final, external } = res.data;
+    const targetPath = final?.resume_docx_path || external.resume_docx_path;
     setExportStatus(targetPath ? `Saved to ${targetPath}` : "DOCX saved.");
   };
 
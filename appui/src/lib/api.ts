@@ -63,8 +63,6 @@ export const api = {
   post: <T>(path: string, body: any) => request<T>(path, { method: 'POST', body: JSON.stringify(body) }),
   patch: <T>(path: string, body: any) => request<T>(path, { method: 'PATCH', body: JSON.stringify(body) }),
 
-  health: () => request<{ status: string; ok: boolean }>('/health'),
-
   uploadResumes: (files: File[]) => {
     const form = new FormData();
     files.forEach((file) => form.append('files', file));
@@ -82,6 +80,7 @@ export const api = {
     bullets_per_role?: number;
     use_experience_inventory?: boolean;
     max_roles?: number | null;
+    no_cache?: boolean;
   }) => request<GenerateResponse>('/generate', { method: 'POST', body: JSON.stringify(payload) }),
 
   getResume: (resumeId: string) => request<ResumeStateResponse>(`/resumes/${resumeId}`),
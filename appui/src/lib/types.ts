@@ -105,7 +105,7 @@ export interface ApplyPatchesResponse {
   resume_id: string;
   version: string;
   paths: {
-    resume_json: string | null;
+    resume_json: string;
     resume_docx: string | null;
   };
 }
@@ -123,22 +123,25 @@ export interface BulletEditResponse {
   version: string;
   updated_role: Record<string, string | null>;
   updated_bullet_index: number;
-  paths: Record<string, string | null>;
+  paths: {
+    resume_json: string;
+    resume_docx: string | null;
+  };
+}
+
+export interface ExportLocations {
+  saved_dir: string | null;
+  resume_docx_path: string | null;
+  jd_path: string | null;
 }
 
 export interface ExportDocxResponse {
-  saved_dir: string;
-  resume_docx_path: string;
-  jd_path: string;
+  external: ExportLocations;
+  internal?: ExportLocations | null;
+  final?: ExportLocations | null;
   audit?: ResumeAudit;
   resume_id?: string;
   version?: string;
-  internal_version_dir?: string;
-  internal_resume_docx_path?: string;
-  internal_jd_path?: string;
-  final_saved_dir?: string;
-  final_resume_docx_path?: string;
-  final_jd_path?: string;
 }
 
 export interface TemplateListResponse {
@@ -0,0 +1,80 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.models.schemas import (
+    ApplyPatchesRequest,
+    InsertExperiencePatch,
+    InsertSkillsPatch,
+    PatchOperation,
+    ReplaceExperiencePatch,
+    ReplaceSkillsPatch,
+)
+
+PATCH_ADAPTER = TypeAdapter(PatchOperation)
+
+PATCH_PAYLOADS = [
+    (
+        '{"action": "replace", "section": "experience", "role_id": "r1", "bullet_index": 0,'
+        ' "new_bullet": "Cut p95 latency by 40%"}',
+        ReplaceExperiencePatch,
+    ),
+    (
+        '{"action": "replace", "section": "technical_skills", "bullet_index": 2,'
+        ' "new_bullet": "Languages: Python, Go"}',
+        ReplaceSkillsPatch,
+    ),
+    (
+        '{"action": "insert", "section": "experience", "role_id": "r1", "after_index": 3,'
+        ' "new_bullet": "Built Airflow pipelines", "skill": "Airflow", "reason": "JD must-have"}',
+        InsertExperiencePatch,
+    ),
+    (
+        '{"action": "insert", "section": "technical_skills", "after_index": 0,'
+        ' "new_bullet": "Cloud: AWS, GCP"}',
+        InsertSkillsPatch,
+    ),
+]
+
+
+@pytest.mark.parametrize("raw,expected", PATCH_PAYLOADS)
+def test_patch_kinds_validate_from_json(raw, expected):
+    patch = PATCH_ADAPTER.validate_json(raw)
+    assert type(patch) is expected
+    assert isinstance(patch.action, str) and isinstance(patch.section, str)
+
+
+@pytest.mark.parametrize("raw,expected", PATCH_PAYLOADS)
+def test_patch_kinds_round_trip(raw, expected):
+    patch = PATCH_ADAPTER.validate_json(raw)
+    again = PATCH_ADAPTER.validate_json(PATCH_ADAPTER.dump_json(patch))
+    assert type(again) is expected
+    assert again == patch
+
+
+def test_patch_section_defaults_to_experience():
+    patch = PATCH_ADAPTER.validate_json(
+        '{"action": "insert", "role_id": "r1", "after_index": 1, "new_bullet": "Led incident reviews"}'
+    )
+    assert type(patch) is InsertExperiencePatch
+    assert patch.section == "experience"
+
+
+def test_apply_patches_request_accepts_mixed_kinds():
+    body = '{"patches": [' + ", ".join(raw for raw, _ in PATCH_PAYLOADS) + "]}"
+    request = ApplyPatchesRequest.model_validate_json(body)
+    assert [type(p) for p in request.patches] == [expected for _, expected in PATCH_PAYLOADS]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"action": "delete", "section": "experience", "role_id": "r1", "bullet_index": 0,'
+        ' "new_bullet": "Cut p95 latency by 40%"}',
+        '{"action": "replace", "section": "summary", "bullet_index": 0, "new_bullet": "Cut p95 latency by 40%"}',
+        '{"section": "experience", "role_id": "r1", "bullet_index": 0, "new_bullet": "Cut p95 latency by 40%"}',
+    ],
+)
+def test_unknown_patch_kind_is_rejected(raw):
+    with pytest.raises(ValidationError) as exc:
+        PATCH_ADAPTER.validate_json(raw)
+    assert exc.value.errors()[0]["type"] == "union_tag_invalid"
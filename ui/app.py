@@ -54,8 +54,14 @@ client = ApiClient(st.session_state.backend_url)
 def _get_export_open_target(export_data: dict | None) -> str | None:
     if not export_data:
         return None
-    for key in ("final_resume_docx_path", "resume_docx_path", "final_saved_dir", "saved_dir"):
-        value = export_data.get(key)
+    final = export_data.get("final") or {}
+    external = export_data.get("external") or {}
+    for value in (
+        final.get("resume_docx_path"),
+        external.get("resume_docx_path"),
+        final.get("saved_dir"),
+        external.get("saved_dir"),
+    ):
         if value:
             return str(value)
     return None